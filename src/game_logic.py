@@ -55,7 +55,7 @@ class Entity:
 class GameLogicProcess:
     def __init__(self, game_state, player_score, player_health, player_position,
                  game_state_lock, player_score_lock, player_health_lock, player_position_lock,
-                 logic_to_render_queue, render_to_logic_queue):
+                 logic_to_render_queue, render_to_logic_queue, entity_table):
         self.game_state = game_state
         self.player_score = player_score
         self.player_health = player_health
@@ -68,6 +68,7 @@ class GameLogicProcess:
         
         self.logic_to_render_queue = logic_to_render_queue
         self.render_to_logic_queue = render_to_logic_queue
+        self.entity_table = entity_table
         
         self.entities = {}
         self.entity_id_counter = 0
@@ -282,9 +283,11 @@ class GameLogicProcess:
         while True:
             # Only spawn when playing
             with self.game_state_lock:
-                if self.game_state.value != GameState.PLAYING.value:
-                    time.sleep(0.5)
-                    continue
+                playing = self.game_state.value == GameState.PLAYING.value
+            if not playing:
+                # Sleep after releasing the lock so the other processes aren't blocked meanwhile
+                time.sleep(0.5)
+                continue
             
             # Calculate spawn interval based on wave (gets shorter as waves progress)
             # Reduced wave scaling (0.15 instead of 0.2) to slow down difficulty increase
@@ -362,9 +365,11 @@ class GameLogicProcess:
         while True:
             # Only spawn when playing
             with self.game_state_lock:
-                if self.game_state.value != GameState.PLAYING.value:
-                    time.sleep(1.0)
-                    continue
+                playing = self.game_state.value == GameState.PLAYING.value
+            if not playing:
+                # Sleep after releasing the lock so the other processes aren't blocked meanwhile
+                time.sleep(1.0)
+                continue
             
             # 15% chance to spawn a power-up every 4 seconds (reduced from 20% every 3 seconds)
             if random.random() < 0.15:
@@ -783,55 +788,35 @@ class GameLogicProcess:
             print(f"Wave {self.wave_number} starting! Defeat {self.enemies_to_kill_for_next_wave} enemies to advance.")
     
     def update_game_state(self):
-        """Send updated game state to the renderer"""
-        entity_data = []
+        """Publish updated game state to the renderer"""
+        entity_rows = []
         
         with self.entities_lock:
             for entity in self.entities.values():
-                data = {
-                    'id': entity.id,
-                    'type': entity.type.value,
-                    'x': entity.x,
-                    'y': entity.y,
-                    'width': entity.width,
-                    'height': entity.height,
-                    'enemy_type': getattr(entity, 'enemy_type', 0),
-                    'powerup_type': getattr(entity, 'powerup_type', 0)
-                }
-                
-                # Add velocity data for player entity
-                if entity.type == EntityType.PLAYER:
-                    data['velocity_x'] = entity.velocity_x
-                    data['velocity_y'] = entity.velocity_y
-                    data['facing_right'] = self.player_facing_right
-                
-                # Add additional fields if they exist
-                if hasattr(entity, 'direction'):
-                    data['direction'] = entity.direction
-                
-                # Add weapon type for projectiles
-                if entity.type == EntityType.PROJECTILE and hasattr(entity, 'weapon_type'):
-                    data['weapon_type'] = entity.weapon_type
-                
-                # Add wave information for enemies
-                if entity.type == EntityType.ENEMY and hasattr(entity, 'wave'):
-                    data['wave'] = entity.wave
-                
-                entity_data.append(data)
+                # Fields follow shared_state.ENTITY_DTYPE order
+                entity_rows.append((
+                    entity.id,
+                    entity.type.value,
+                    entity.x,
+                    entity.y,
+                    entity.width,
+                    entity.height,
+                    getattr(entity, 'enemy_type', 0),
+                    getattr(entity, 'powerup_type', 0),
+                    getattr(entity, 'weapon_type', 0),
+                    getattr(entity, 'wave', 0),
+                    getattr(entity, 'direction', 0),
+                    entity.velocity_x,
+                    entity.velocity_y,
+                    self.player_facing_right
+                ))
         
         # Calculate elapsed game time
         current_time = time.time()
         elapsed_time = current_time - self.game_start_time
         
-        game_data = {
-            'entities': entity_data,
-            'wave': self.wave_number,
-            'wave_progress': self.wave_progress,  # Add wave progress
-            'player_facing_right': self.player_facing_right,  # Send player direction to renderer
-            'game_time': elapsed_time  # Send elapsed time to renderer
-        }
-        
-        self.logic_to_render_queue.put(game_data)
+        # Write the snapshot into shared memory instead of pickling it through the queue
+        self.entity_table.publish(entity_rows, self.wave_number, self.wave_progress, elapsed_time)
     
     def run(self):
         """Main game loop"""
@@ -121,6 +121,10 @@ class IntroSequence:
         
         # Text for intro
         self.font = pygame.font.Font(None, 100)
+        
+        # Skip hint, rendered once since it never changes
+        self.skip_text = pygame.font.Font(None, 24).render("Press SPACE to skip", True, (200, 200, 200))
+        self.skip_text.set_alpha(150)
         self.text_alpha = 0
         self.text_scale = 0.1  # For text zoom effect
     
@@ -550,8 +554,7 @@ class IntroSequence:
         # This will draw text regardless of state, after a certain amount of time has passed
         elif elapsed > 15.0:  # Increased from 12.0 to 15.0 seconds, only if not already in aftermath state
             # Force draw the text, regardless of state
-            font = pygame.font.Font(None, 100)
-            text = font.render("Cosmic Conflict Begins...", True, (255, 0, 0))  # Bright red for high visibility
+            text = self.font.render("Cosmic Conflict Begins...", True, (255, 0, 0))  # Bright red for high visibility
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             
             # Draw black background
@@ -566,9 +569,7 @@ class IntroSequence:
         screen.blit(display, self.camera_offset)
         
         # Draw skip message (directly to the screen, not affected by camera shake)
-        skip_text = pygame.font.Font(None, 24).render("Press SPACE to skip", True, (200, 200, 200))
-        skip_text.set_alpha(150)
-        screen.blit(skip_text, (self.screen_width - 200, self.screen_height - 30))
+        screen.blit(self.skip_text, (self.screen_width - 200, self.screen_height - 30))
     
     def is_completed(self):
         """Check if the intro sequence is complete"""
@@ -11,6 +11,7 @@ from multiprocessing import Process, Queue, Value, Lock, Array
 from game_logic import GameLogicProcess
 from renderer import RendererProcess
 from intro_sequence import IntroSequence
+from shared_state import EntityTable
 
 # Constants
 WINDOW_WIDTH = 1200
@@ -56,9 +57,12 @@ def main():
     
     # Create shared resources with proper synchronization
     game_state = Value('i', 0)  # 0: Menu, 1: Playing, 2: Paused, 3: Game Over
-    player_score = Value('i', 0)
-    player_health = Value('i', 100)
-    player_position = Array('i', [WINDOW_WIDTH // 4, WINDOW_HEIGHT // 2])
+    
+    # Player stats have a single writer (the logic process) and the renderer only reads
+    # them, and int reads are atomic, so they skip the per-access lock
+    player_score = Value('i', 0, lock=False)
+    player_health = Value('i', 100, lock=False)
+    player_position = Array('i', [WINDOW_WIDTH // 4, WINDOW_HEIGHT // 2], lock=False)
     
     # Create locks for shared resources
     game_state_lock = Lock()
@@ -70,13 +74,16 @@ def main():
     logic_to_render_queue = Queue()
     render_to_logic_queue = Queue()
     
+    # Shared-memory entity snapshots, written by logic and read by the renderer
+    entity_table = EntityTable()
+    
     # Create processes
     logic_process = Process(
         target=GameLogicProcess,
         args=(
             game_state, player_score, player_health, player_position,
             game_state_lock, player_score_lock, player_health_lock, player_position_lock,
-            logic_to_render_queue, render_to_logic_queue
+            logic_to_render_queue, render_to_logic_queue, entity_table
         )
     )
     logic_process.daemon = True  # Make the logic process a daemon so it exits when main exits
@@ -87,7 +94,7 @@ def main():
             WINDOW_WIDTH, WINDOW_HEIGHT,
             game_state, player_score, player_health, player_position,
             game_state_lock, player_score_lock, player_health_lock, player_position_lock,
-            logic_to_render_queue, render_to_logic_queue
+            logic_to_render_queue, render_to_logic_queue, entity_table
         )
     )
     render_process.daemon = True  # Make the render process a daemon so it exits when main exits
@@ -108,6 +115,8 @@ def main():
         print(f"Error in game execution: {e}")
     finally:
         # Clean up
+        entity_table.close()
+        entity_table.unlink()
         pygame.quit()
         print("Game shut down successfully")
 
@@ -2,10 +2,12 @@
 import os
 import sys
 import pygame
-import threading
 import time
 import random
 import math
+import queue
+from collections import OrderedDict
+import numpy as np
 from multiprocessing import Value, Lock, Queue
 from enum import Enum
 
@@ -14,6 +16,7 @@ from game_logic import GameState, EntityType
 
 # Constants
 FPS = 60
+MAX_FRAME_DT = 0.1  # Longest step (seconds) time-based animation takes after a stall
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 FONT_SIZE = 32
@@ -32,10 +35,281 @@ DARK_BLUE = (0, 0, 50)
 LIGHT_BLUE = (100, 100, 255)
 ORANGE = (255, 165, 0)
 
+# Transparent color for opaque sprites (black is used inside the sprites themselves)
+COLORKEY = (255, 0, 255)
+
+# Capacity of each particle pool
+MAX_PARTICLES = 4096
+
+# Maximum number of rendered text surfaces kept around for reuse
+TEXT_CACHE_SIZE = 256
+
+# Seconds per frame the renderer spends handling events from the logic process
+EVENT_BUDGET = 0.002
+
+# Seconds between redraws of the system metrics panel (5 Hz)
+INFO_PANEL_INTERVAL = 0.2
+
+# Discrete flame sizes used for the flicker effect, pre-scaled into the flame sheet
+FLAME_SCALES = [0.9 + 0.5 * step / 7 for step in range(8)]
+
+# One background star; layers are record arrays of these, updated in place
+STAR_DTYPE = np.dtype([
+    ('x', np.float32),
+    ('y', np.int16),
+    ('radius', np.int8),
+    ('brightness', np.uint8),
+    ('offset', np.float64)  # Twinkle phase offset
+])
+
+# One nebula cloud; its pre-rendered surface is kept in a parallel list
+NEBULA_DTYPE = np.dtype([
+    ('x', np.float64),
+    ('y', np.int16),
+    ('radius', np.int16),
+    ('alpha', np.float64),
+    ('speed', np.float64)  # Leftward drift per 50 ms step
+])
+
+def animate_star_layer(stars, drift, phase):
+    """Drift a star layer to the left and set its sine twinkle brightness, in place"""
+    stars.x -= drift
+    stars.x %= WINDOW_WIDTH
+    stars.brightness = np.sin(phase + stars.offset) * 55 + 200
+
+# Length of one display frame at FPS, in nanoseconds
+FRAME_NS = 1_000_000_000 // FPS
+FRAME_MS = 1000 // FPS
+
+def frame_index(now_ns, period_ns, count):
+    """Animation frame shown at now_ns (monotonic clock) when each frame lasts period_ns"""
+    return (now_ns // period_ns) % count
+
+# Unit vectors to the ten points of a five-pointed star (tips and inner corners alternate)
+STAR_DIRECTIONS = np.stack([np.cos(np.arange(10) * math.pi / 5), np.sin(np.arange(10) * math.pi / 5)], axis=1)
+
+def star_polygon(center, angle, outer, inner):
+    """Points of a five-pointed star with its first tip at angle, rotated with one matrix product"""
+    rotation = np.array([[math.cos(angle), -math.sin(angle)],
+                         [math.sin(angle), math.cos(angle)]])
+    radii = np.tile([outer, inner], 5)[:, np.newaxis]
+    return (np.matmul(STAR_DIRECTIONS * radii, rotation.T) + center).tolist()
+
+# One period of sine sampled at 1024 steps, for per-frame pulse and hover effects
+SIN_STEPS = 1024
+SIN_TABLE = np.sin(np.linspace(0, 2 * math.pi, SIN_STEPS, endpoint=False)).tolist()
+
+def fast_sin(angle):
+    """Table lookup of sin(angle), accurate to the 1024-step resolution of SIN_TABLE"""
+    return SIN_TABLE[int(angle * (SIN_STEPS / (2 * math.pi))) & (SIN_STEPS - 1)]
+
+# Brightness pulse of the highlighted prompts, sin(ticks * 0.005) * 0.3 + 0.7, sampled at 64 steps
+# per ~1.26 s period (about one step per frame at FPS) as ready-made colors
+PULSE_STEPS = 64
+PULSE_COLORS = tuple((int(255 * p), int(255 * p), int(100 * p))
+                     for p in (math.sin(i * 2 * math.pi / PULSE_STEPS) * 0.3 + 0.7 for i in range(PULSE_STEPS)))
+
+def pulse_step(ticks):
+    """Index into PULSE_COLORS for pygame.time.get_ticks() value ticks"""
+    return int(ticks * (0.005 * PULSE_STEPS / (2 * math.pi))) & (PULSE_STEPS - 1)
+
+def vertical_gradient(width, height, color, alphas):
+    """Alpha surface of one color whose per-row alpha comes from alphas, written in one array copy"""
+    surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    surf.fill((*color[:3], 0))
+    pygame.surfarray.pixels_alpha(surf)[:] = np.asarray(alphas, dtype=np.uint8)[np.newaxis, :]
+    return surf
+
+# Stars twinkle through 16 gray levels; finer steps aren't visible on a 1-3 px dot
+GRAY16 = np.arange(16, dtype=np.uint8) * 17
+
+# Tiny color-keyed gray disc sprites keyed by (radius, gray level), drawn once with pygame.draw.circle
+STAR_SPRITES = {}
+
+def star_sprite(radius, level):
+    """Sprite of a star of this radius at one of the GRAY16 levels, centered at (radius, radius)"""
+    sprite = STAR_SPRITES.get((radius, level))
+    if sprite is None:
+        gray = int(GRAY16[level])
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.fill(COLORKEY)
+        pygame.draw.circle(sprite, (gray, gray, gray), (radius, radius), radius)
+        sprite.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        sprite = sprite.convert()
+        STAR_SPRITES[(radius, level)] = sprite
+    return sprite
+
+def draw_star_layer(surface, stars, grow=0, min_radius=1, shift=0):
+    """Draw a star layer with a single Surface.blits call of pre-rendered star sprites
+    
+    A nonzero shift scrolls the layer that many whole pixels to the left, wrapping at the screen seam.
+    """
+    keep = stars.radius >= min_radius
+    radius = (stars.radius[keep] + grow).tolist()
+    x = stars.x[keep].astype(np.int32)
+    if shift:
+        x = (x - shift) % WINDOW_WIDTH
+    left = (x - radius).tolist()
+    top = (stars.y[keep].astype(np.int32) - radius).tolist()
+    level = (stars.brightness[keep] >> 4).tolist()
+    surface.blits([(star_sprite(r, l), (x, y)) for r, l, x, y in zip(radius, level, left, top)], doreturn=False)
+
+def integrate_particles(x, y, dx, dy, size, life, shrink, gravity):
+    """Elementwise pass: advance every particle one frame in place
+    
+    Each index is independent, so this pass could be split across workers;
+    at MAX_PARTICLES per pool it finishes in microseconds, well under the
+    cost of handing work to threads.
+    """
+    # In-place ufuncs so a step allocates nothing
+    np.subtract(life, 1, out=life)
+    np.subtract(size, shrink, out=size)
+    np.maximum(size, 1, out=size)
+    np.add(x, dx, out=x)
+    np.add(y, dy, out=y)
+    np.add(dy, gravity, out=dy)
+
+def step_particles(n, fields, shrink, gravity):
+    """Integrate the first n particles of (x, y, dx, dy, size, life, color) arrays in place
+    and pack the survivors to the front; returns the new live count"""
+    x, y, dx, dy, size, life, _ = (field[:n] for field in fields)
+    integrate_particles(x, y, dx, dy, size, life, shrink, gravity)
+    
+    # Serial pass: compact the survivors to the front of every field in one masked gather per array
+    alive = np.flatnonzero(life > 0)
+    count = len(alive)
+    if count != n:
+        for field in fields:
+            field[:count] = field[alive]
+    return count
+
+class ParticlePool:
+    """Fixed-capacity particle storage as parallel arrays; live particles occupy slots [0, count)
+    
+    Nothing is allocated after construction. Slots stay in spawn order (compaction is
+    stable), so once every slot is live the oldest particles, at the front, are dropped
+    to make room for new ones.
+    """
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.dx = np.zeros(capacity, dtype=np.float32)
+        self.dy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.fields = (self.x, self.y, self.dx, self.dy, self.size, self.life, self.color)
+    
+    def __len__(self):
+        return self.count
+    
+    def drop_oldest(self, n):
+        """Release the n oldest particles, shifting the rest down to the front"""
+        keep = self.count - n
+        for field in self.fields:
+            field[:keep] = field[n:self.count]
+        self.count = keep
+    
+    def spawn(self, x, y, color, size, lifetime, dx=0, dy=0):
+        """Claim the next free slot for a particle, dropping the oldest one when full; returns the slot"""
+        if self.count >= self.capacity:
+            self.drop_oldest(1)
+        i = self.count
+        self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.size[i] = size
+        self.life[i] = lifetime
+        self.color[i] = color
+        return i
+    
+    def spawn_many(self, x, y, color, size, lifetime, dx, dy):
+        """Add a batch of particles from per-particle arrays; returns how many were written"""
+        n = min(len(size), self.capacity)
+        overflow = self.count + n - self.capacity
+        if overflow > 0:
+            self.drop_oldest(overflow)
+        slots = slice(self.count, self.count + n)
+        self.x[slots] = x[:n] if np.ndim(x) else x
+        self.y[slots] = y[:n] if np.ndim(y) else y
+        self.dx[slots] = dx[:n]
+        self.dy[slots] = dy[:n]
+        self.size[slots] = size[:n]
+        self.life[slots] = lifetime[:n]
+        self.color[slots] = color[:n]
+        self.count += n
+        return n
+    
+    def update(self, shrink, gravity=0.0):
+        """Advance all live particles one frame and release the ones that expired"""
+        self.count = step_particles(self.count, self.fields, shrink, gravity)
+    
+    def items(self):
+        """Iterate live particles as (x, y, color, size, lifetime) tuples"""
+        n = self.count
+        return zip(self.x[:n].tolist(), self.y[:n].tolist(), map(tuple, self.color[:n].tolist()),
+                   self.size[:n].tolist(), self.life[:n].tolist())
+    
+    # Pixel offsets of a filled disc, keyed by the particle's int(size * 2) footprint
+    _stamps = {}
+    
+    @classmethod
+    def stamp(cls, span):
+        """Rasterize the disc pygame.draw.circle produces for a particle of this footprint"""
+        offsets = cls._stamps.get(span)
+        if offsets is None:
+            radius = span // 2
+            surf = pygame.Surface((span, span), pygame.SRCALPHA)
+            pygame.draw.circle(surf, WHITE, (radius, radius), radius)
+            offsets = np.nonzero(pygame.surfarray.array_alpha(surf))
+            cls._stamps[span] = offsets
+        return offsets
+    
+    @staticmethod
+    def draw_all(surface, layers):
+        """Alpha-blend the live particles of several (pool, lifespan) layers, earlier layers underneath later ones
+        
+        Each layer takes one pixel write per disc size, so where two discs of the
+        same size and layer overlap the later one wins instead of compounding;
+        at these sizes and fade levels the difference is not visible.
+        """
+        pixels = pygame.surfarray.pixels3d(surface)
+        width, height = pixels.shape[:2]
+        for pool, lifespan in layers:
+            count = pool.count
+            if not count:
+                continue
+            size = pool.size[:count]
+            color = pool.color[:count]
+            # Fade out as lifetime decreases, relative to the layer's lifespan
+            alpha = np.minimum(pool.life[:count] * 255 // lifespan, 255)
+            spans = (size * 2).astype(np.int32)
+            left = (pool.x[:count] - size).astype(np.int32)
+            top = (pool.y[:count] - size).astype(np.int32)
+            for span in np.unique(spans).tolist():
+                group = spans == span
+                ox, oy = ParticlePool.stamp(span)
+                px = left[group][:, None] + ox
+                py = top[group][:, None] + oy
+                inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+                px = px[inside]
+                py = py[inside]
+                # Broadcast per-particle color/alpha over the stamp, keeping only on-screen pixels
+                src = np.broadcast_to(color[group][:, None, :], inside.shape + (3,))[inside].astype(np.int32)
+                a = np.broadcast_to(alpha[group][:, None], inside.shape)[inside][:, None]
+                dst = pixels[px, py].astype(np.int32)
+                # Same integer blend SDL uses for per-pixel alpha blits
+                pixels[px, py] = dst + (((src - dst) * a + src) >> 8)
+        del pixels
+
 class RendererProcess:
     def __init__(self, width, height, game_state, player_score, player_health, player_position,
                 game_state_lock, player_score_lock, player_health_lock, player_position_lock,
-                logic_to_render_queue, render_to_logic_queue):
+                logic_to_render_queue, render_to_logic_queue, entity_table):
         """Initialize the renderer process"""
         # Initialize debug flag for showing platform reachability
         self.show_debug_info = False
@@ -55,6 +329,10 @@ class RendererProcess:
         self.logic_to_render_queue = logic_to_render_queue
         self.render_to_logic_queue = render_to_logic_queue
         
+        # Entity snapshots published by the logic process in shared memory
+        self.entity_table = entity_table
+        self.entity_version = 0
+        
         # Game timer tracking
         self.game_time = 0.0
         
@@ -62,6 +340,9 @@ class RendererProcess:
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Cosmic Conflict")
         self.clock = pygame.time.Clock()
+        self.frame_dt = 0.0  # Seconds the last frame took, for time-based animation
+        self.frame_ticks = 0  # pygame.time.get_ticks() sampled once at the start of each frame
+        self.frame_state = GameState.MENU.value  # game_state value read once at the start of each frame
         
         # Initialize pygame mixer for sound
         pygame.mixer.init()
@@ -75,50 +356,84 @@ class RendererProcess:
         self.main_font = pygame.font.SysFont('Arial', 30)
         self.small_font = pygame.font.SysFont('Arial', 20)
         self.title_font = pygame.font.SysFont('Arial', 60, bold=True)
+        # Large banner titles on the menu, game over and pause screens
+        self.banner_font = pygame.font.SysFont('Arial', 72, bold=True)
+        # Fallback for metric values too wide for the small font
+        self.smaller_font = pygame.font.SysFont('Arial', SMALL_FONT_SIZE - 2)
+        
+        # Rendered text surfaces keyed by (font, text, color), least recently used first
+        self._text_cache = OrderedDict()
+        # Pre-rendered circles and glows keyed by their shape and color
+        self._circle_cache = {}
+        self._glow_cache = {}
+        self._platform_cache = {}
+        self._platform_glow_cache = {}
+        self._bar_cache = {}
+        # Pulsing prompts keyed by text: [white mask, centered x, tinted step, tinted surface]
+        self._pulse_cache = {}
         
         # Initialize background elements
         self.stars = self.generate_stars(150)
         self.far_stars = self.generate_stars(100)
         self.near_stars = self.generate_stars(50)
-        self.nebulas = self.generate_nebulas(5)
+        self.nebulas, self.nebula_surfs = self.generate_nebulas(5)
+        self.star_twinkle = self.twinkle_coefficients(self.stars)
+        self.near_halo_surf = self.create_star_halo_surface(self.near_stars)
+        self.near_scroll = 0.0
         self.parallax_offset = 0
+        self.twinkle_counter = 0
         self.last_frame_time = time.time()
         
         # Load game assets
         self.load_assets()
-        
-        # Initialize animation state
-        self.player_anim_counter = 0
-        self.player_anim_delay = 10
-        self.player_frame_idx = 0
-        
-        self.flame_anim_counter = 0
-        self.flame_anim_delay = 5
-        self.flame_anim_idx = 0
-        
-        self.enemy1_anim_counter = 0
-        self.enemy1_anim_delay = 15
-        self.enemy1_frame_idx = 0
-        
-        self.enemy2_anim_counter = 0
-        self.enemy2_anim_delay = 20
-        self.enemy2_frame_idx = 0
-        
-        self.enemy3_anim_counter = 0
-        self.enemy3_anim_delay = 10
-        self.enemy3_frame_idx = 0
-        
-        self.powerup1_frame_idx = 0
-        self.powerup2_frame_idx = 0
-        self.powerup3_frame_idx = 0
-        self.frame_counter = 0
+        self.controls_bar = self.create_controls_bar()
+        self.info_panel_surf = None
+        self.process_info_surf = None
+        self.process_info_time = 0
+        # Full-screen menu, game over and pause backdrops: the dimming overlay with the screen's
+        # static text already drawn on it, so each takes a single blit per frame
+        self.menu_screen = self.create_modal_backdrop((0, 0, 0, 180), self.create_menu_blits())
+        self.game_over_screen = self.create_modal_backdrop(
+            (0, 0, 0, 180), [self.centered_text(self.banner_font, "GAME OVER", RED, 150)])
+        self.pause_screen = self.create_modal_backdrop(
+            (0, 0, 30, 180), [self.centered_text(self.banner_font, "PAUSED", WHITE, 200)])
+        # Game over result lines, rebuilt when the (score, wave) they show changes; the survival
+        # time is fixed when the game ends
+        self.final_time = 0
+        self.game_over_key = None
+        self.game_over_lines = []
+        # Copy of the last game frame, redrawn under the pause and game over screens
+        self.frozen_frame = None
+        # Screen areas of a modal screen that change from frame to frame over a frozen frame
+        self.pulse_rects = []
+        
+        # Animation table: (frame index attribute, period in ns, frames). Frame indices are derived
+        # from the monotonic clock, periods are a number of display frames at FPS, and frames
+        # is looked up each time since enemy frame lists are rebuilt for new waves
+        self.animations = [
+            ('player_frame_idx', 10 * FRAME_NS, lambda: self.player_frames),
+            ('flame_anim_idx', 5 * FRAME_NS, lambda: self.flame_rects['right']),
+            ('enemy1_frame_idx', 15 * FRAME_NS, lambda: self.enemy1_frames),
+            ('enemy2_frame_idx', 20 * FRAME_NS, lambda: self.enemy2_frames),
+            ('enemy3_frame_idx', 10 * FRAME_NS, lambda: self.enemy3_frames),
+            ('powerup1_frame_idx', 10 * FRAME_NS, lambda: self.powerup1_frames),
+            ('powerup2_frame_idx', 10 * FRAME_NS, lambda: self.powerup2_frames),
+            ('powerup3_frame_idx', 10 * FRAME_NS, lambda: self.powerup3_frames),
+        ]
+        for attr, _, _ in self.animations:
+            setattr(self, attr, 0)
         
         # Initialize background elements
         self.create_background()
+        # Parts of the window outside the WINDOW_WIDTH x WINDOW_HEIGHT background (none at the default size)
+        self.background_margins = [rect for rect in (pygame.Rect(WINDOW_WIDTH, 0, width - WINDOW_WIDTH, height),
+                                                     pygame.Rect(0, WINDOW_HEIGHT, width, height - WINDOW_HEIGHT))
+                                   if rect.width > 0 and rect.height > 0]
         
         # Track pressed keys for continuous input
         self.keys_pressed = {}
         self.keys_just_pressed = {}
+        self._last_keys_sent = None  # Last input snapshot put on the queue
         
         # Initialize process info display
         self.show_process_info = False
@@ -139,20 +454,21 @@ class RendererProcess:
         self.powerup_message_end_time = 0
         self.powerup_pickup_animation = []
         
+        # When the current pause began, so message timers can resume after it
+        self.pause_started = 0
+        
         # Initialize particle systems
         self.explosions = []
-        self.projectile_particles = []
-        self.explosion_particles = []
+        self.projectile_particles = ParticlePool()
+        self.explosion_particles = ParticlePool()
         self.explosion_glows = []
+        self.player_flame = None
+        # Particle effects draw their random values in batches from one generator
+        self._rng = np.random.default_rng()
         
         # Initialize entity tracking
         self.entities = []
         
-        # Start animation thread
-        self.animation_thread = threading.Thread(target=self.animate_background)
-        self.animation_thread.daemon = True
-        self.animation_thread.start()
-        
         # Start the game loop
         self.run()
     
@@ -211,13 +527,153 @@ class RendererProcess:
             'projectile2': self.create_projectile_sprite(2),  # Secondary weapon (plasma ball, green)
             'background': self.create_background()
         }
+        
+        # Convert sprites to the display pixel format so blits skip per-pixel conversion
+        # (enemy frames are converted in create_enemy_sprite, which also runs for later waves)
+        self.assets = {name: self.convert_sprite(surf) for name, surf in self.assets.items()}
+        self.player_frames = [self.convert_sprite(surf) for surf in self.player_frames]
+        self.flame_atlas = self.convert_sprite(self.flame_atlas)
+        self.powerup1_frames = [self.convert_sprite(surf) for surf in self.powerup1_frames]
+        self.powerup2_frames = [self.convert_sprite(surf) for surf in self.powerup2_frames]
+        self.powerup3_frames = [self.convert_sprite(surf) for surf in self.powerup3_frames]
+        
+        # Pulsing glow behind each powerup type, one frame per glow size from 40 to 50 px
+        powerup_glow_colors = {
+            1: (0, 255, 0, 50),  # Health
+            2: (255, 255, 0, 50),  # Score
+            3: (0, 100, 255, 50)  # Invincibility
+        }
+        self.powerup_glow_frames = {
+            powerup_type: [self.get_circle(size // 2, color) for size in range(40, 51)]
+            for powerup_type, color in powerup_glow_colors.items()
+        }
+        
+        # Radial glows drawn behind projectiles, blue for the primary weapon and green for the secondary
+        self.projectile_glows = {
+            1: self.create_projectile_glow(20, (100, 100, 255)),
+            2: self.create_projectile_glow(30, (50, 255, 100))
+        }
+    
+    def render_text(self, font, text, color):
+        """Render antialiased text, reusing the surface when the same string was drawn recently"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+    
+    def pulse_text(self, text, step):
+        """Prompt tinted to the pulse color of this step; returns (surface, centered x)
+        
+        Each prompt is rasterized once in white and re-tinted with a multiply fill
+        whenever the pulse step changes, instead of rendering the glyphs again.
+        """
+        entry = self._pulse_cache.get(text)
+        if entry is None:
+            mask = self.main_font.render(text, True, WHITE).convert_alpha()
+            entry = [mask, self.width//2 - mask.get_width()//2, None, None]
+            self._pulse_cache[text] = entry
+        mask, x, tinted_step, surf = entry
+        if tinted_step != step:
+            surf = mask.copy()
+            surf.fill(PULSE_COLORS[step], special_flags=pygame.BLEND_RGB_MULT)
+            entry[2:] = step, surf
+        return surf, x
+    
+    def centered_text(self, font, text, color, y):
+        """Render text horizontally centered on the screen as a (surface, position) blit pair"""
+        surf = self.render_text(font, text, color)
+        return surf, (self.width//2 - surf.get_width()//2, y)
+    
+    def get_circle(self, radius, color, width=0):
+        """Return a cached alpha surface holding one circle; callers fade it with set_alpha"""
+        key = (radius, color, width)
+        surf = self._circle_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius, radius), radius, width)
+            surf = surf.convert_alpha()
+            self._circle_cache[key] = surf
+        return surf
+    
+    def create_projectile_glow(self, glow_size, glow_color):
+        """Pre-render the radial gradient drawn behind a projectile"""
+        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+        for radius in range(int(glow_size/2), 0, -1):
+            alpha = int(150 * (radius / (glow_size/2)))
+            pygame.draw.circle(glow_surf, (*glow_color, alpha), (int(glow_size/2), int(glow_size/2)), radius)
+        return glow_surf.convert_alpha()
+    
+    def get_explosion_glow_frames(self, color):
+        """Return the enemy explosion glow for each remaining lifetime, scaled up as it fades"""
+        frames = self._glow_cache.get(color)
+        if frames is None:
+            glowing_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
+            for radius in range(50, 0, -5):
+                alpha = min(150, 200 - radius * 3)
+                pygame.draw.circle(glowing_surf, (*color, alpha), (50, 50), radius)
+            frames = [None]
+            for lifetime in range(1, 11):
+                # Grows by 50% as it fades; 10 is the initial lifetime
+                scale_factor = 1.0 + (1.0 - lifetime / 10) * 0.5
+                new_size = (int(100 * scale_factor), int(100 * scale_factor))
+                frames.append(pygame.transform.scale(glowing_surf, new_size).convert_alpha())
+            self._glow_cache[color] = frames
+        return frames
+    
+    def solid_surface(self, size, color):
+        """Return a cached opaque surface of one color, for bars drawn by blitting a sub-rect of it"""
+        key = (size, color)
+        surf = self._bar_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size).convert()
+            surf.fill(color)
+            self._bar_cache[key] = surf
+        return surf
+    
+    def scaled_platform(self, width, height):
+        """Return the platform sprite stretched to the given size, scaling each size only once"""
+        key = (width, height)
+        surf = self._platform_cache.get(key)
+        if surf is None:
+            surf = pygame.transform.scale(self.assets['platform'], key)
+            self._platform_cache[key] = surf
+        return surf
+    
+    def platform_glow(self, width):
+        """Return the glow strip drawn above a platform edge, built once per platform width"""
+        surf = self._platform_glow_cache.get(width)
+        if surf is None:
+            surf = vertical_gradient(width, 5, (100, 200, 255), 150 - np.arange(5) * 30).convert_alpha()
+            self._platform_glow_cache[width] = surf
+        return surf
+    
+    def create_sprite_surface(self, size, alpha=False):
+        """Create a blank sprite surface; per-pixel alpha only when the sprite blends, otherwise color-keyed"""
+        if alpha:
+            return pygame.Surface(size, pygame.SRCALPHA)
+        surf = pygame.Surface(size)
+        surf.fill(COLORKEY)
+        surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return surf
+    
+    def convert_sprite(self, surf):
+        """Convert a surface to the display pixel format, keeping per-pixel alpha if it has any"""
+        if surf.get_flags() & pygame.SRCALPHA:
+            return surf.convert_alpha()
+        return surf.convert()
     
     def create_player_sprite(self):
         """Create player sprite with animation frames"""
         frames = []
         
         # Base player frame
-        base_surf = pygame.Surface((50, 80), pygame.SRCALPHA)
+        base_surf = self.create_sprite_surface((50, 80))
         # Body
         pygame.draw.rect(base_surf, BLUE, (5, 10, 40, 50))
         # Head
@@ -238,24 +694,24 @@ class RendererProcess:
         
         # Frame 2 - Arms slightly different position
         frame2 = base_surf.copy()
-        pygame.draw.rect(frame2, (0, 0, 0, 0), (0, 20, 10, 30), 0)  # Clear previous arm
-        pygame.draw.rect(frame2, (0, 0, 0, 0), (40, 20, 10, 30), 0)  # Clear previous arm
+        pygame.draw.rect(frame2, COLORKEY, (0, 20, 10, 30), 0)  # Clear previous arm
+        pygame.draw.rect(frame2, COLORKEY, (40, 20, 10, 30), 0)  # Clear previous arm
         pygame.draw.rect(frame2, BLUE, (0, 15, 10, 30))  # New arm position
         pygame.draw.rect(frame2, BLUE, (40, 25, 10, 30))  # New arm position
         frames.append(frame2)
         
         # Frame 3 - Legs slightly different position
         frame3 = base_surf.copy()
-        pygame.draw.rect(frame3, (0, 0, 0, 0), (10, 60, 10, 20), 0)  # Clear previous leg
-        pygame.draw.rect(frame3, (0, 0, 0, 0), (30, 60, 10, 20), 0)  # Clear previous leg
+        pygame.draw.rect(frame3, COLORKEY, (10, 60, 10, 20), 0)  # Clear previous leg
+        pygame.draw.rect(frame3, COLORKEY, (30, 60, 10, 20), 0)  # Clear previous leg
         pygame.draw.rect(frame3, BLUE, (12, 60, 10, 20))  # New leg position
         pygame.draw.rect(frame3, BLUE, (28, 60, 10, 20))  # New leg position
         frames.append(frame3)
         
         # Frame 4 - Combination of different limb positions
         frame4 = frame2.copy()
-        pygame.draw.rect(frame4, (0, 0, 0, 0), (10, 60, 10, 20), 0)  # Clear previous leg
-        pygame.draw.rect(frame4, (0, 0, 0, 0), (30, 60, 10, 20), 0)  # Clear previous leg
+        pygame.draw.rect(frame4, COLORKEY, (10, 60, 10, 20), 0)  # Clear previous leg
+        pygame.draw.rect(frame4, COLORKEY, (30, 60, 10, 20), 0)  # Clear previous leg
         pygame.draw.rect(frame4, BLUE, (8, 60, 10, 20))  # New leg position
         pygame.draw.rect(frame4, BLUE, (32, 60, 10, 20))  # New leg position
         frames.append(frame4)
@@ -291,23 +747,40 @@ class RendererProcess:
             left_flame = pygame.transform.flip(flame, True, False)
             left_flames.append(left_flame)
         
+        # Pack every flame frame at every flicker scale into one sprite sheet, drawn via source rects:
+        # one row per scale step, frames side by side
+        flames = right_flames + left_flames
+        rows = [[pygame.transform.scale(f, (int(f.get_width() * scale), int(f.get_height() * scale)))
+                 for f in flames] for scale in FLAME_SCALES]
+        atlas = pygame.Surface((max(sum(f.get_width() for f in row) for row in rows),
+                                sum(max(f.get_height() for f in row) for row in rows)),
+                               pygame.SRCALPHA)
+        flame_rects = [[] for _ in flames]
+        atlas_y = 0
+        for row in rows:
+            atlas_x = 0
+            for i, flame in enumerate(row):
+                flame_rects[i].append(atlas.blit(flame, (atlas_x, atlas_y)))
+                atlas_x += flame.get_width()
+            atlas_y += max(f.get_height() for f in row)
+        
         # Add the animation details to the class
         self.player_frames = frames
         self.player_frame_idx = 0
-        self.player_anim_delay = 8
-        self.player_anim_counter = 0
-        self.player_right_flames = right_flames
-        self.player_left_flames = left_flames
+        self.flame_atlas = atlas
+        self.flame_rects = {
+            'right': flame_rects[:len(right_flames)],
+            'left': flame_rects[len(right_flames):]
+        }
         self.flame_anim_idx = 0
-        self.flame_anim_delay = 5
-        self.flame_anim_counter = 0
         
         # Return the first frame as the initial sprite
         return frames[0]
     
     def create_platform_sprite(self):
         """Create an enhanced platform sprite with tech details"""
-        surf = pygame.Surface((200, 20), pygame.SRCALPHA)
+        # The gradient covers every pixel, so the platform needs neither alpha nor a color key
+        surf = pygame.Surface((200, 20))
         
         # Base platform with gradient
         for y in range(20):
@@ -332,11 +805,12 @@ class RendererProcess:
         pygame.draw.line(surf, (80, 80, 100), (0, 0), (200, 0), 2)
         pygame.draw.line(surf, (30, 30, 50), (0, 19), (200, 19), 2)
         
-        # Add subtle highlights
+        # Add subtle highlights, blended onto the top edge
+        highlight = pygame.Surface((21, 1))
+        highlight.fill((200, 200, 255))
+        highlight.set_alpha(50)
         for i in range(0, 200, 40):
-            # Use proper RGBA color format
-            highlight_color = (200, 200, 255, 50)
-            pygame.draw.line(surf, highlight_color, (i, 0), (i+20, 0), 1)
+            surf.blit(highlight, (i, 0))
         
         return surf
     
@@ -360,7 +834,7 @@ class RendererProcess:
         
         if enemy_type == 1:  # Basic enemy - circle shape
             for frame in range(4):  # 4 animation frames
-                frame_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                frame_surf = self.create_sprite_surface((size, size), alpha=is_enhanced)
                 
                 # Base color gets more intense with waves
                 if is_elite:
@@ -417,7 +891,7 @@ class RendererProcess:
         
         elif enemy_type == 2:  # Tough enemy - square shape
             for frame in range(4):
-                frame_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                frame_surf = self.create_sprite_surface((size, size), alpha=is_enhanced)
                 
                 # Base color gets more intense with waves
                 if is_elite:
@@ -488,7 +962,7 @@ class RendererProcess:
         
         elif enemy_type == 3:  # Fast enemy - triangle shape
             for frame in range(4):
-                frame_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                frame_surf = self.create_sprite_surface((size, size), alpha=is_enhanced)
                 
                 # Base color gets more intense with waves
                 if is_elite:
@@ -564,6 +1038,8 @@ class RendererProcess:
                 
                 frames.append(frame_surf)
         
+        frames = [self.convert_sprite(surf) for surf in frames]
+        
         # Store the frames in the appropriate class variable based on enemy type
         if enemy_type == 1:
             self.enemy1_frames = frames
@@ -614,8 +1090,6 @@ class RendererProcess:
             
             self.powerup1_frames = frames
             self.powerup1_frame_idx = 0
-            self.powerup1_anim_counter = 0
-            self.powerup1_anim_delay = 8
             
             return frames[0]
             
@@ -631,16 +1105,7 @@ class RendererProcess:
             # Inner detail
             pygame.draw.circle(surf1, (255, 255, 200), (15, 15), 8)
             # Star shape
-            star_points = []
-            for i in range(5):
-                angle = math.pi/2 + i * 2*math.pi/5
-                x1 = 15 + 10 * math.cos(angle)
-                y1 = 15 + 10 * math.sin(angle)
-                angle += math.pi/5
-                x2 = 15 + 5 * math.cos(angle)
-                y2 = 15 + 5 * math.sin(angle)
-                star_points.extend([(x1, y1), (x2, y2)])
-            pygame.draw.polygon(surf1, (255, 200, 0), star_points)
+            pygame.draw.polygon(surf1, (255, 200, 0), star_polygon(15, math.pi/2, 10, 5))
             frames.append(surf1)
             
             # Frame 2 - rotating star
@@ -648,16 +1113,7 @@ class RendererProcess:
             pygame.draw.circle(surf2, (255, 255, 0, 70), (15, 15), 14)
             pygame.draw.circle(surf2, YELLOW, (15, 15), 11)
             pygame.draw.circle(surf2, (255, 255, 200), (15, 15), 7)
-            star_points = []
-            for i in range(5):
-                angle = math.pi/5 + i * 2*math.pi/5  # Rotated star
-                x1 = 15 + 9 * math.cos(angle)
-                y1 = 15 + 9 * math.sin(angle)
-                angle += math.pi/5
-                x2 = 15 + 4 * math.cos(angle)
-                y2 = 15 + 4 * math.sin(angle)
-                star_points.extend([(x1, y1), (x2, y2)])
-            pygame.draw.polygon(surf2, (255, 200, 0), star_points)
+            pygame.draw.polygon(surf2, (255, 200, 0), star_polygon(15, math.pi/5, 9, 4))  # Rotated star
             frames.append(surf2)
             
             # Frame 3 - further rotation
@@ -665,22 +1121,11 @@ class RendererProcess:
             pygame.draw.circle(surf3, (255, 255, 0, 90), (15, 15), 13)
             pygame.draw.circle(surf3, YELLOW, (15, 15), 10)
             pygame.draw.circle(surf3, (255, 255, 200), (15, 15), 6)
-            star_points = []
-            for i in range(5):
-                angle = 3*math.pi/10 + i * 2*math.pi/5  # Further rotated
-                x1 = 15 + 8 * math.cos(angle)
-                y1 = 15 + 8 * math.sin(angle)
-                angle += math.pi/5
-                x2 = 15 + 4 * math.cos(angle)
-                y2 = 15 + 4 * math.sin(angle)
-                star_points.extend([(x1, y1), (x2, y2)])
-            pygame.draw.polygon(surf3, (255, 200, 0), star_points)
+            pygame.draw.polygon(surf3, (255, 200, 0), star_polygon(15, 3*math.pi/10, 8, 4))  # Further rotated
             frames.append(surf3)
             
             self.powerup2_frames = frames
             self.powerup2_frame_idx = 0
-            self.powerup2_anim_counter = 0
-            self.powerup2_anim_delay = 10
             
             return frames[0]
             
@@ -720,8 +1165,6 @@ class RendererProcess:
             
             self.powerup3_frames = frames
             self.powerup3_frame_idx = 0
-            self.powerup3_anim_counter = 0
-            self.powerup3_anim_delay = 12
             
             return frames[0]
     
@@ -729,13 +1172,13 @@ class RendererProcess:
         """Create projectile sprite based on weapon type"""
         if weapon_type == 1:
             # Primary weapon - blue energy bolt
-            projectile = pygame.Surface((10, 10), pygame.SRCALPHA)
+            projectile = self.create_sprite_surface((10, 10))
             pygame.draw.circle(projectile, (50, 100, 255), (5, 5), 5)  # Blue core
             pygame.draw.circle(projectile, (150, 200, 255), (5, 5), 3)  # Lighter center
             return projectile
         else:
             # Secondary weapon - green plasma ball
-            projectile = pygame.Surface((15, 15), pygame.SRCALPHA)
+            projectile = self.create_sprite_surface((15, 15))
             # Create a glowing effect with multiple layers
             pygame.draw.circle(projectile, (0, 100, 0), (7, 7), 7)  # Dark green base
             pygame.draw.circle(projectile, (0, 200, 50), (7, 7), 5)  # Medium green
@@ -746,98 +1189,111 @@ class RendererProcess:
     
     def create_background(self):
         """Create starfield background"""
-        surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        # Create a gradient background from dark blue to black
-        for y in range(WINDOW_HEIGHT):
-            # Calculate the ratio of position
-            ratio = y / WINDOW_HEIGHT
-            # Create a gradient from dark blue to black
-            r = int(DARK_BLUE[0] * (1 - ratio))
-            g = int(DARK_BLUE[1] * (1 - ratio))
-            b = int(DARK_BLUE[2] * (1 - ratio) + BLACK[2] * ratio)
-            color = (r, g, b)
-            pygame.draw.line(surf, color, (0, y), (WINDOW_WIDTH, y))
-        return surf
+        # Create a vertical gradient from dark blue to black in a single array pass
+        ratio = (np.arange(WINDOW_HEIGHT) / WINDOW_HEIGHT)[np.newaxis, :]
+        pixels = np.empty((WINDOW_WIDTH, WINDOW_HEIGHT, 3), dtype=np.uint8)
+        pixels[:, :, 0] = DARK_BLUE[0] * (1 - ratio)
+        pixels[:, :, 1] = DARK_BLUE[1] * (1 - ratio)
+        pixels[:, :, 2] = DARK_BLUE[2] * (1 - ratio) + BLACK[2] * ratio
+        # Match the display format so the per-frame blit is a straight copy
+        return pygame.surfarray.make_surface(pixels).convert()
     
     def generate_stars(self, count):
-        """Generate random stars for the background"""
-        stars = []
-        for _ in range(count):
-            x = random.randint(0, WINDOW_WIDTH)
-            y = random.randint(0, WINDOW_HEIGHT)
-            size = random.randint(1, 3)
-            brightness = random.randint(100, 255)
-            color = (brightness, brightness, brightness)
-            stars.append((x, y, size, color, random.random() * 2 - 1))  # x, y, size, color, twinkle_offset
+        """Generate random stars for the background as a record array"""
+        stars = np.zeros(count, dtype=STAR_DTYPE).view(np.recarray)
+        stars.x = np.random.randint(0, WINDOW_WIDTH + 1, count)
+        stars.y = np.random.randint(0, WINDOW_HEIGHT + 1, count)
+        stars.radius = np.random.randint(1, 4, count)
+        stars.brightness = np.random.randint(100, 256, count)
+        stars.offset = np.random.random(count) * 2 - 1
         return stars
     
     def generate_nebulas(self, count):
-        """Generate colorful nebula clouds"""
-        nebulas = []
+        """Generate colorful nebula clouds as a record array and their pre-rendered surfaces"""
         colors = [(255, 100, 100), (100, 100, 255), (255, 100, 255), 
                  (100, 255, 255), (255, 255, 100)]
         
-        for _ in range(count):
-            x = random.randint(0, WINDOW_WIDTH)
-            y = random.randint(0, WINDOW_HEIGHT)
-            radius = random.randint(100, 300)
-            color = random.choice(colors)
-            alpha = random.randint(20, 40)
-            speed = random.random() * 0.2
-            nebulas.append((x, y, radius, color, alpha, speed))
-        
-        return nebulas
-    
-    def animate_background(self):
-        """Thread to animate background elements"""
-        twinkle_counter = 0
-        while True:
-            twinkle_counter += 0.1
-            self.parallax_offset += 0.1
-            
-            # Animate stars
-            for i, star in enumerate(self.stars):
-                # Make stars twinkle by varying brightness based on time and offset
-                x, y, size, color, offset = star
-                brightness = int(abs(127 * (1 + (offset + 1) * 0.3 * 
-                                  (0.9 + 0.2 * (3 + offset) * 
-                                   (0.9 + 0.1 * size) * 
-                                   (0.9 + 0.1 * (1 + offset) * 
-                                    (0.9 + 0.1 * (1 + size) * 
-                                     (0.9 + 0.1 * (1 + offset) * 
-                                      (0.9 + 0.1 * (1 + size) * 
-                                       (0.9 + 0.1 * (1 + twinkle_counter)
-                                   ))))))) % 155 + 100))
-                new_color = (brightness, brightness, brightness)
-                self.stars[i] = (x, y, size, new_color, offset)
-            
-            # Similar for near and far stars with different speeds
-            for i, star in enumerate(self.near_stars):
-                x, y, size, color, offset = star
-                # Make near stars move faster (parallax effect)
-                x = (x - 0.5) % WINDOW_WIDTH
-                brightness = int((math.sin(twinkle_counter + offset) * 55 + 200))
-                new_color = (brightness, brightness, brightness)
-                self.near_stars[i] = (x, y, size, new_color, offset)
-                
-            for i, star in enumerate(self.far_stars):
-                x, y, size, color, offset = star
-                # Make far stars move slower
-                x = (x - 0.1) % WINDOW_WIDTH
-                brightness = int((math.sin(twinkle_counter * 0.5 + offset) * 55 + 200))
-                new_color = (brightness, brightness, brightness)
-                self.far_stars[i] = (x, y, size, new_color, offset)
-            
-            # Animate nebulas
-            for i, nebula in enumerate(self.nebulas):
-                x, y, radius, color, alpha, speed = nebula
-                # Slowly move nebulas
-                x = (x - speed) % (WINDOW_WIDTH + radius * 2)
-                # Pulse alpha with bounds checking
-                new_alpha = max(0, min(255, int(alpha + math.sin(twinkle_counter * 0.2) * 5)))
-                self.nebulas[i] = (x, y, radius, color, new_alpha, speed)
-            
-            time.sleep(0.05)
+        nebulas = np.zeros(count, dtype=NEBULA_DTYPE).view(np.recarray)
+        nebulas.x = np.random.randint(0, WINDOW_WIDTH + 1, count)
+        nebulas.y = np.random.randint(0, WINDOW_HEIGHT + 1, count)
+        nebulas.radius = np.random.randint(100, 301, count)
+        nebulas.alpha = np.random.randint(20, 41, count)
+        nebulas.speed = np.random.random(count) * 0.2
+        surfaces = [self.create_nebula_surface(int(radius), random.choice(colors)) for radius in nebulas.radius]
+        return nebulas, surfaces
+    
+    def create_nebula_surface(self, radius, color):
+        """Pre-render a soft nebula cloud at full strength; its overall alpha is set per frame"""
+        nebula_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+        # Draw a soft gradient circle
+        for r in range(radius, 0, -10):
+            current_alpha = int(255 * (r / radius))
+            pygame.draw.circle(nebula_surf, (color[0], color[1], color[2], current_alpha), (radius, radius), r)
+        return nebula_surf.convert_alpha()
+    
+    def create_star_halo_surface(self, stars):
+        """Pre-render the glow behind the larger near stars as a color-keyed layer that is scrolled with them
+        
+        The glow is capped at brightness 150 and near stars never twinkle below 145,
+        so it always lands on the same gray level and never needs redrawing.
+        Each star is also stamped one screen width to either side, so glows
+        crossing the edges continue on the next tile.
+        """
+        halo_stars = stars.copy()
+        halo_stars.brightness = 150
+        surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        surf.fill(COLORKEY)
+        for wrap in (-WINDOW_WIDTH, 0, WINDOW_WIDTH):
+            halo_stars.x = stars.x + wrap
+            draw_star_layer(surf, halo_stars, grow=2, min_radius=2)
+        surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return surf.convert()
+    
+    def twinkle_level(self, offset, size, twinkle_counter):
+        """Raw twinkle level of a middle-layer star before wrapping into the brightness range"""
+        return abs(127 * (1 + (offset + 1) * 0.3 * 
+                          (0.9 + 0.2 * (3 + offset) * 
+                           (0.9 + 0.1 * size) * 
+                           (0.9 + 0.1 * (1 + offset) * 
+                            (0.9 + 0.1 * (1 + size) * 
+                             (0.9 + 0.1 * (1 + offset) * 
+                              (0.9 + 0.1 * (1 + size) * 
+                               (0.9 + 0.1 * (1 + twinkle_counter)
+                           ))))))))
+    
+    def twinkle_coefficients(self, stars):
+        """Precompute (base, rate) arrays so that level = base + rate * twinkle_counter
+        
+        The twinkle level is linear in the counter, so sampling it at 0 and 1 once
+        gives exact coefficients and the per-tick update becomes a multiply-add.
+        """
+        base = self.twinkle_level(stars.offset, stars.radius, 0)
+        rate = self.twinkle_level(stars.offset, stars.radius, 1) - base
+        return base, rate
+    
+    def update_background(self, dt):
+        """Advance background animation by dt seconds"""
+        self.twinkle_counter += dt * 2
+        self.parallax_offset += dt * 2
+        twinkle_counter = self.twinkle_counter
+        
+        # Make middle stars twinkle by varying brightness based on time and offset
+        base, rate = self.star_twinkle
+        self.stars.brightness = (base + rate * twinkle_counter) % 155 + 100
+        
+        # Near stars move faster than far stars (parallax effect), in pixels per second
+        # Near stars keep their build positions and are drawn shifted by near_scroll, like their glow
+        animate_star_layer(self.near_stars, 0, twinkle_counter)
+        self.near_scroll = (self.near_scroll + 10 * dt) % WINDOW_WIDTH
+        animate_star_layer(self.far_stars, 2 * dt, twinkle_counter * 0.5)
+        
+        # Animate nebulas; speeds were tuned per 50 ms step, hence the factor of 20
+        nebulas = self.nebulas
+        # Slowly move nebulas
+        nebulas.x -= nebulas.speed * (20 * dt)
+        nebulas.x %= WINDOW_WIDTH + nebulas.radius * 2
+        # Pulse alpha with bounds checking
+        nebulas.alpha = np.clip(nebulas.alpha + math.sin(twinkle_counter * 0.2) * 100 * dt, 0, 255)
     
     def handle_events(self):
         """Handle pygame events"""
@@ -867,12 +1323,11 @@ class RendererProcess:
                     sys.exit()
                 
                 # Check for ESC in game over state to exit directly from renderer too
-                with self.game_state_lock:
-                    if self.game_state.value == GameState.GAME_OVER.value and event.key == pygame.K_ESCAPE:
-                        # Send an exit command to the logic process
-                        self.render_to_logic_queue.put({'type': 'exit_game'})
-                        pygame.quit()
-                        sys.exit()
+                if self.frame_state == GameState.GAME_OVER.value and event.key == pygame.K_ESCAPE:
+                    # Send an exit command to the logic process
+                    self.render_to_logic_queue.put({'type': 'exit_game'})
+                    pygame.quit()
+                    sys.exit()
                 
                 # Debug key to toggle platform reachability visualization
                 if event.key == pygame.K_d:
@@ -881,19 +1336,31 @@ class RendererProcess:
             elif event.type == pygame.KEYUP:
                 self.keys_pressed[event.key] = False
         
-        # Send current input state to game logic
-        input_data = {
-            'type': 'input',
-            'keys': self.keys_pressed,
-            'key_press': self.keys_just_pressed  # Send the just-pressed keys separately
-        }
-        self.render_to_logic_queue.put(input_data)
+        # Send current input state to game logic, skipping idle frames where nothing changed.
+        # Held keys are resent every frame because the logic process only acts on them
+        # (rapid fire, jumping) when an input message arrives.
+        held = tuple(sorted(k for k, v in self.keys_pressed.items() if v))
+        cur = (held, tuple(self.keys_just_pressed))
+        if cur != self._last_keys_sent or held:
+            input_data = {
+                'type': 'input',
+                'keys': self.keys_pressed,
+                'key_press': self.keys_just_pressed  # Send the just-pressed keys separately
+            }
+            self.render_to_logic_queue.put(input_data)
+            self._last_keys_sent = cur
     
     def receive_game_state(self):
         """Receive and process game state from logic process"""
         try:
-            if not self.logic_to_render_queue.empty():
-                game_data = self.logic_to_render_queue.get_nowait()
+            # Drain the events queued since the last frame, within a time budget so a burst
+            # can't stall the frame; whatever is left is picked up next frame, still in order
+            deadline = time.perf_counter() + EVENT_BUDGET
+            while time.perf_counter() < deadline:
+                try:
+                    game_data = self.logic_to_render_queue.get_nowait()
+                except queue.Empty:
+                    break
                 
                 # Check if this is a wave message
                 if game_data.get('type') == 'wave_message':
@@ -952,12 +1419,16 @@ class RendererProcess:
                 elif game_data.get('type') == 'hurt':
                     if 'hurt' in self.sounds:
                         self.sounds['hurt'].play()
-                else:
-                    # Regular game state update
-                    self.entities = game_data.get('entities', [])
-                    self.current_wave = game_data.get('wave', 1)
-                    self.wave_progress = game_data.get('wave_progress', 0)
-                    self.game_time = game_data.get('game_time', 0.0)  # Update game time
+            
+            # Pick up the latest entity snapshot if the logic process published a new one
+            snapshot = self.entity_table.read(self.entity_version)
+            if snapshot is not None:
+                self.entity_version, header, rows = snapshot
+                names = rows.dtype.names
+                self.entities = [dict(zip(names, row)) for row in rows.tolist()]
+                self.current_wave = int(header['wave'])
+                self.wave_progress = float(header['wave_progress'])
+                self.game_time = float(header['game_time'])  # Update game time
         except Exception as e:
             print(f"Error receiving game state: {e}")
     
@@ -967,117 +1438,57 @@ class RendererProcess:
         self.screen.blit(self.assets['background'], (0, 0))
         
         # Draw nebulas (furthest layer)
-        for x, y, radius, color, alpha, _ in self.nebulas:
-            # Create a surface for the nebula with alpha channel
-            nebula_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-            # Draw a soft gradient circle
-            for r in range(radius, 0, -10):
-                current_alpha = int(alpha * (r / radius))
-                # Create a proper RGBA tuple instead of concatenating
-                rgba_color = (color[0], color[1], color[2], current_alpha)
-                pygame.draw.circle(nebula_surf, rgba_color, (radius, radius), r)
-            # Blit the nebula
-            self.screen.blit(nebula_surf, (int(x - radius), int(y - radius)))
+        nebulas = self.nebulas
+        left = (nebulas.x - nebulas.radius).astype(np.int32).tolist()
+        top = (nebulas.y - nebulas.radius).tolist()
+        for nebula_surf, x, y, alpha in zip(self.nebula_surfs, left, top, nebulas.alpha.astype(np.int32).tolist()):
+            # Fade the pre-rendered cloud instead of redrawing its gradient
+            nebula_surf.set_alpha(alpha)
+            self.screen.blit(nebula_surf, (x, y))
         
         # Draw far stars (slow moving)
-        for x, y, size, color, _ in self.far_stars:
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), size)
+        draw_star_layer(self.screen, self.far_stars)
         
         # Draw middle layer stars
-        for x, y, size, color, _ in self.stars:
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), size)
-        
-        # Draw near stars (fast moving)
-        for x, y, size, color, _ in self.near_stars:
-            # Draw with a slight glow effect
-            if size > 1:
-                glow_size = size + 2
-                glow_color = (min(color[0], 150), min(color[1], 150), min(color[2], 150))
-                pygame.draw.circle(self.screen, glow_color, (int(x), int(y)), glow_size)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), size)
+        draw_star_layer(self.screen, self.stars)
+        
+        # Scroll the cached glow behind the larger near stars, wrapping at the screen seam
+        scroll_x = int(self.near_scroll)
+        self.screen.blit(self.near_halo_surf, (-scroll_x, 0))
+        self.screen.blit(self.near_halo_surf, (WINDOW_WIDTH - scroll_x, 0))
+        
+        # Draw near stars (fast moving) on top of their glow, shifted by the same whole pixels
+        draw_star_layer(self.screen, self.near_stars, shift=scroll_x)
     
     def update_animations(self):
         """Update animation frames for all entities"""
-        # Update player animation
-        self.player_anim_counter += 1
-        if self.player_anim_counter >= self.player_anim_delay:
-            self.player_anim_counter = 0
-            self.player_frame_idx = (self.player_frame_idx + 1) % len(self.player_frames)
-        
-        # Update flame animation
-        self.flame_anim_counter += 1
-        if self.flame_anim_counter >= self.flame_anim_delay:
-            self.flame_anim_counter = 0
-            self.flame_anim_idx = (self.flame_anim_idx + 1) % len(self.player_right_flames)
-        
-        # Update enemy animations
-        self.enemy1_anim_counter += 1
-        if self.enemy1_anim_counter >= self.enemy1_anim_delay:
-            self.enemy1_anim_counter = 0
-            self.enemy1_frame_idx = (self.enemy1_frame_idx + 1) % len(self.enemy1_frames)
-            
-        self.enemy2_anim_counter += 1
-        if self.enemy2_anim_counter >= self.enemy2_anim_delay:
-            self.enemy2_anim_counter = 0
-            self.enemy2_frame_idx = (self.enemy2_frame_idx + 1) % len(self.enemy2_frames)
-            
-        self.enemy3_anim_counter += 1
-        if self.enemy3_anim_counter >= self.enemy3_anim_delay:
-            self.enemy3_anim_counter = 0
-            self.enemy3_frame_idx = (self.enemy3_frame_idx + 1) % len(self.enemy3_frames)
-            
+        # Pick every animation frame from the clock instead of stepping counters, so calling
+        # this more than once per frame can't advance an animation twice
+        now_ns = time.monotonic_ns()
+        for attr, period_ns, frames in self.animations:
+            setattr(self, attr, frame_index(now_ns, period_ns, len(frames())))
+        
         # Update projectile particles
-        for i, particle in enumerate(self.projectile_particles):
-            x, y, color, size, lifetime, dx, dy = particle
-            lifetime -= 1
-            size = max(1, size - 0.2)
-            x += dx
-            y += dy
-            if lifetime <= 0:
-                self.projectile_particles.pop(i)
-            else:
-                self.projectile_particles[i] = (x, y, color, size, lifetime, dx, dy)
-        
-        # Update explosion particles
-        for i, particle in enumerate(self.explosion_particles):
-            x, y, color, size, lifetime, dx, dy = particle
-            lifetime -= 1
-            size = max(1, size - 0.1)
-            x += dx
-            y += dy
-            dy += 0.05  # Gravity effect
-            if lifetime <= 0:
-                self.explosion_particles.pop(i)
-            else:
-                self.explosion_particles[i] = (x, y, color, size, lifetime, dx, dy)
+        self.projectile_particles.update(shrink=0.2)
+        
+        # Update explosion particles (with gravity effect)
+        self.explosion_particles.update(shrink=0.1, gravity=0.05)
         
-        # Update explosion glow effects
-        for i, glow in enumerate(self.explosion_glows[:]):
+        # New trail and flame particles join after the step, so they are drawn at full life
+        self.spawn_entity_particles()
+        
+        # Update explosion glow effects, keeping only the ones still alive
+        for glow in self.explosion_glows:
             glow['lifetime'] -= 1
-            if glow['lifetime'] <= 0:
-                self.explosion_glows.pop(i)
-                
-        # Update powerup animations
-        self.frame_counter += 1
-        if self.frame_counter >= 10:  # Update powerup frames every 10 frames
-            self.frame_counter = 0
-            # Update powerup animation frames
-            if hasattr(self, 'powerup1_frames') and self.powerup1_frames:
-                self.powerup1_frame_idx = (self.powerup1_frame_idx + 1) % len(self.powerup1_frames)
-            if hasattr(self, 'powerup2_frames') and self.powerup2_frames:
-                self.powerup2_frame_idx = (self.powerup2_frame_idx + 1) % len(self.powerup2_frames)
-            if hasattr(self, 'powerup3_frames') and self.powerup3_frames:
-                self.powerup3_frame_idx = (self.powerup3_frame_idx + 1) % len(self.powerup3_frames)
-                
-        # Update powerup pickup animation
-        i = 0
-        while i < len(self.powerup_pickup_animation):
-            ring = self.powerup_pickup_animation[i]
+        self.explosion_glows = [glow for glow in self.explosion_glows if glow['lifetime'] > 0]
+        
+        # Update powerup pickup animation, collecting survivors instead of popping mid-list
+        alive_rings = []
+        for ring in self.powerup_pickup_animation:
             # Process delay
             if ring['delay'] > 0:
                 ring['delay'] -= 1
-                self.powerup_pickup_animation[i] = ring
-                i += 1
+                alive_rings.append(ring)
                 continue
                 
             # Expand the ring
@@ -1085,28 +1496,88 @@ class RendererProcess:
             # Fade out as it expands
             ring['alpha'] = max(0, int(200 * (1 - ring['radius'] / ring['max_radius'])))
             
-            # Remove rings that have expanded fully
-            if ring['radius'] >= ring['max_radius'] or ring['alpha'] <= 0:
-                self.powerup_pickup_animation.pop(i)
+            # Drop rings that have expanded fully
+            if ring['radius'] < ring['max_radius'] and ring['alpha'] > 0:
+                alive_rings.append(ring)
+        self.powerup_pickup_animation = alive_rings
+    
+    def spawn_entity_particles(self):
+        """Emit this frame's projectile trails and jet flame particles, so drawing only reads state"""
+        self.player_flame = None
+        for entity in self.entities:
+            entity_type = entity['type']
+            x = entity['x']
+            y = entity['y']
+            
+            if entity_type == EntityType.PROJECTILE.value:
+                # Create particle trail based on weapon type
+                weapon_type = entity.get('weapon_type', 1)
+                self.create_projectile_trail(x + (5 if weapon_type == 1 else 7), 
+                                            y + (5 if weapon_type == 1 else 7),
+                                            weapon_type)
+            
+            elif entity_type == EntityType.PLAYER.value:
+                self.player_flame = self.create_player_flame(x, y, entity['width'], entity.get('facing_right', True))
+    
+    def create_player_flame(self, x, y, width, facing_right):
+        """Pick this frame's jet flame and emit its particles; returns (flame_rect, x, y) or None"""
+        if random.random() <= 0.1:  # Occasionally skip for flickering
+            return None
+        
+        # Choose flame based on current animation frame
+        flame_index = self.flame_anim_idx
+        flame_step = random.randrange(len(FLAME_SCALES))  # Random size for flickering
+        
+        # When facing right, flame should be on LEFT side
+        # When facing left, flame should be on RIGHT side
+        side = 'left' if facing_right else 'right'
+        flame_rect = self.flame_rects[side][flame_index][flame_step]
+        flame_width = flame_rect.width
+        flame_height = flame_rect.height
+        
+        # Position flame beside the player, a little away from it
+        if facing_right:
+            flame_x = x - flame_width - 5
+        else:
+            flame_x = x + width + 5
+        flame_y = y + 30 - (flame_height // 2)
+        flame_y += random.randint(-2, 2)  # Add slight jitter
+        
+        # Add particle effects from flame, blown away from the player
+        if random.random() > 0.5:
+            if facing_right:
+                particle_x = flame_x + random.randint(0, 5)
+                particle_dx = -2
             else:
-                # Update the ring
-                self.powerup_pickup_animation[i] = ring
-                i += 1
+                particle_x = flame_x + flame_width - random.randint(0, 5)
+                particle_dx = 2
+            particle_y = flame_y + random.randint(0, flame_height)
+            particle_color = random.choice([YELLOW, ORANGE, RED])
+            particle_size = random.uniform(1, 3)
+            particle_lifetime = random.randint(5, 15)
+            self.projectile_particles.spawn(
+                particle_x, particle_y, particle_color, 
+                particle_size, particle_lifetime, particle_dx, random.uniform(-0.5, 0.5)
+            )
+        
+        return flame_rect, flame_x, flame_y
     
     def create_explosion(self, x, y, color=(255, 100, 0), count=30):
         """Create particle explosion effect"""
-        for _ in range(count):
-            angle = random.random() * math.pi * 2
-            speed = random.random() * 3 + 1
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            size = random.random() * 4 + 2
-            lifetime = random.randint(20, 40)
-            # Slightly randomize the color
-            r = min(255, max(0, color[0] + random.randint(-20, 20)))
-            g = min(255, max(0, color[1] + random.randint(-20, 20)))
-            b = min(255, max(0, color[2] + random.randint(-20, 20)))
-            self.explosion_particles.append((x, y, (r, g, b), size, lifetime, dx, dy))
+        # Draw every particle's angle, speed and size in one batch
+        u = self._rng.random((count, 3))
+        angle = u[:, 0] * math.pi * 2
+        speed = u[:, 1] * 3 + 1
+        size = u[:, 2] * 4 + 2
+        lifetime = self._rng.integers(20, 41, count)
+        # Slightly randomize the color
+        rgb = self.jittered_colors(color, count)
+        self.explosion_particles.spawn_many(x, y, rgb, size, lifetime,
+                                            np.cos(angle) * speed, np.sin(angle) * speed)
+    
+    def jittered_colors(self, color, count):
+        """count copies of an RGB color, each channel shifted by up to 20 either way"""
+        return np.clip(np.array(color[:3]) + self._rng.integers(-20, 21, (count, 3)), 0, 255)
     
     def create_enemy_explosion(self, x, y, enemy_type=1, wave=1):
         """Create an explosion effect when an enemy is destroyed"""
@@ -1170,15 +1641,9 @@ class RendererProcess:
             ring_y = center_y + math.sin(angle) * distance
             self.create_explosion(ring_x, ring_y, color=color, count=3)
             
-        # Add glowing effect at the center
-        glowing_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-        for radius in range(50, 0, -5):
-            alpha = min(150, 200 - radius * 3)
-            pygame.draw.circle(glowing_surf, (*color, alpha), (50, 50), radius)
-        
-        # Store the glowing effect with a lifetime
+        # Add glowing effect at the center, using the pre-scaled frames for this color
         self.explosion_glows.append({
-            'surface': glowing_surf,
+            'frames': self.get_explosion_glow_frames(tuple(color)),
             'x': center_x - 50,
             'y': center_y - 50,
             'lifetime': 10
@@ -1186,90 +1651,48 @@ class RendererProcess:
     
     def create_projectile_trail(self, x, y, weapon_type=1):
         """Create particle trail behind projectiles based on weapon type"""
-        for _ in range(3):
-            size = random.uniform(1, 3)
-            offset_x = random.uniform(-3, 3)
-            offset_y = random.uniform(-3, 3)
-            lifetime = random.randint(5, 15)
-            
-            if weapon_type == 1:
-                # Blue trail for primary weapon
-                color = BLUE
-            else:
-                # Green trail for secondary weapon
-                color = (0, 200, 50)
-            
-            # Add some variance to the color
-            r = min(255, max(0, color[0] + random.randint(-20, 20)))
-            g = min(255, max(0, color[1] + random.randint(-20, 20)))
-            b = min(255, max(0, color[2] + random.randint(-20, 20)))
-            adjusted_color = (r, g, b)
-            
-            self.projectile_particles.append((x + offset_x, y + offset_y, adjusted_color, size, lifetime, 0, 0))
+        count = 3
+        u = self._rng.random((count, 3))
+        size = u[:, 0] * 2 + 1
+        offset_x = u[:, 1] * 6 - 3
+        offset_y = u[:, 2] * 6 - 3
+        lifetime = self._rng.integers(5, 16, count)
+        
+        if weapon_type == 1:
+            # Blue trail for primary weapon
+            color = BLUE
+        else:
+            # Green trail for secondary weapon
+            color = (0, 200, 50)
+        
+        # Add some variance to the color
+        adjusted_color = self.jittered_colors(color, count)
+        
+        still = np.zeros(count)
+        self.projectile_particles.spawn_many(x + offset_x, y + offset_y, adjusted_color, size, lifetime, still, still)
     
     def draw_entities(self):
         """Draw all game entities with animations"""
         # Draw explosion glows first (they're the furthest back layer)
         for glow in self.explosion_glows:
-            # Apply a fade-out effect as lifetime decreases
-            alpha_factor = glow['lifetime'] / 10  # 10 was the initial lifetime
-            if alpha_factor > 0:
-                # Create a copy of the surface with adjusted alpha
-                fade_surf = glow['surface'].copy()
-                # Scale the surface for a pulsing effect
-                scale_factor = 1.0 + (1.0 - alpha_factor) * 0.5  # Grows by 50% as it fades
-                new_size = (int(fade_surf.get_width() * scale_factor), 
-                           int(fade_surf.get_height() * scale_factor))
-                scaled_surf = pygame.transform.scale(fade_surf, new_size)
+            if glow['lifetime'] > 0:
+                scaled_surf = glow['frames'][glow['lifetime']]
                 
                 # Adjust position to keep the effect centered
-                offset_x = (new_size[0] - fade_surf.get_width()) // 2
-                offset_y = (new_size[1] - fade_surf.get_height()) // 2
+                offset_x = (scaled_surf.get_width() - 100) // 2
+                offset_y = (scaled_surf.get_height() - 100) // 2
                 
                 # Render the glow
                 self.screen.blit(scaled_surf, (glow['x'] - offset_x, glow['y'] - offset_y))
         
-        # Draw explosion particles next (behind everything)
-        for x, y, color, size, lifetime, _, _ in self.explosion_particles:
-            try:
-                # Fade out as lifetime decreases
-                alpha = int(lifetime * 255 / 40)
-                # Make sure color is valid RGB
-                if isinstance(color, tuple) and len(color) >= 3:
-                    # Create proper RGBA color
-                    color_with_alpha = (color[0], color[1], color[2], alpha)
-                else:
-                    # Fallback to white if color is invalid
-                    color_with_alpha = (255, 255, 255, alpha)
-                
-                # Create a temporary surface for the particle with alpha
-                particle_surf = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, color_with_alpha, (int(size), int(size)), int(size))
-                self.screen.blit(particle_surf, (int(x - size), int(y - size)))
-            except ValueError:
-                # Skip drawing this particle if there's an error
-                continue
+        # Draw explosion particles next (behind everything), then projectile trails, in one pass
+        ParticlePool.draw_all(self.screen, [(self.explosion_particles, 40), (self.projectile_particles, 15)])
         
-        # Draw projectile particles (trails)
-        for x, y, color, size, lifetime, _, _ in self.projectile_particles:
-            try:
-                # Fade out as lifetime decreases
-                alpha = int(lifetime * 255 / 15)
-                # Make sure color is valid RGB
-                if isinstance(color, tuple) and len(color) >= 3:
-                    # Create proper RGBA color
-                    color_with_alpha = (color[0], color[1], color[2], alpha)
-                else:
-                    # Fallback to white if color is invalid
-                    color_with_alpha = (255, 255, 255, alpha)
-                
-                # Create a temporary surface for the particle with alpha
-                particle_surf = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, color_with_alpha, (int(size), int(size)), int(size))
-                self.screen.blit(particle_surf, (int(x - size), int(y - size)))
-            except ValueError:
-                # Skip drawing this particle if there's an error
-                continue
+        # Powerup pulse (0 to 1) and hover offset are shared by every powerup this frame
+        ticks = self.frame_ticks
+        powerup_pulse = (fast_sin(ticks * 0.01) + 1) * 0.5
+        powerup_glow_idx = int(10 * powerup_pulse)
+        hover_offset = int(fast_sin(ticks * 0.005) * 3)
         
         # Draw regular entities
         for entity in self.entities:
@@ -1280,78 +1703,10 @@ class RendererProcess:
             height = entity['height']
             
             if entity_type == EntityType.PLAYER.value:
-                # Get player velocity from the game logic - we need to see if it's there
-                player_velocity_x = entity.get('velocity_x', 0)
-                
-                # Make sure we're using the correct data from game logic
-                facing_right = entity.get('facing_right', True)
-                
-                # Draw jet flame based on velocity direction (draw flames BEFORE player so they appear behind)
-                if random.random() > 0.1:  # Occasionally skip for flickering
-                    # Choose flame based on current animation frame
-                    flame_index = self.flame_anim_idx
-                    flame_scale = random.uniform(0.9, 1.4)  # Random size for flickering
-                    
-                    # Important: Make sure we check both velocity AND facing direction
-                    # When facing right, flame should be on LEFT side
-                    # When facing left, flame should be on RIGHT side
-                    if facing_right:  # Facing right -> flame on left
-                        # LEFT flame (appears on left side)
-                        flame_surface = self.player_left_flames[flame_index]
-                        flame_width = int(flame_surface.get_width() * flame_scale)
-                        flame_height = int(flame_surface.get_height() * flame_scale)
-                        
-                        # Scale flame
-                        scaled_flame = pygame.transform.scale(flame_surface, (flame_width, flame_height))
-                        
-                        # Position flame on left side of player - move it further away from player
-                        flame_x = x - flame_width - 5
-                        flame_y = y + 30 - (flame_height // 2)
-                        flame_y += random.randint(-2, 2)  # Add slight jitter
-                        
-                        # Draw the flame
-                        self.screen.blit(scaled_flame, (flame_x, flame_y))
-                        
-                        # Add particle effects from flame
-                        if random.random() > 0.5:
-                            particle_x = flame_x + random.randint(0, 5)
-                            particle_y = flame_y + random.randint(0, flame_height)
-                            particle_color = random.choice([YELLOW, ORANGE, RED])
-                            particle_size = random.uniform(1, 3)
-                            particle_lifetime = random.randint(5, 15)
-                            self.projectile_particles.append((
-                                particle_x, particle_y, particle_color, 
-                                particle_size, particle_lifetime, -2, random.uniform(-0.5, 0.5)
-                            ))
-                            
-                    else:  # Facing left -> flame on right
-                        # RIGHT flame (appears on right side)
-                        flame_surface = self.player_right_flames[flame_index]
-                        flame_width = int(flame_surface.get_width() * flame_scale)
-                        flame_height = int(flame_surface.get_height() * flame_scale)
-                        
-                        # Scale flame
-                        scaled_flame = pygame.transform.scale(flame_surface, (flame_width, flame_height))
-                        
-                        # Position flame on right side of player - move it further away from player
-                        flame_x = x + width + 5
-                        flame_y = y + 30 - (flame_height // 2)
-                        flame_y += random.randint(-2, 2)  # Add slight jitter
-                        
-                        # Draw the flame
-                        self.screen.blit(scaled_flame, (flame_x, flame_y))
-                        
-                        # Add particle effects from flame
-                        if random.random() > 0.5:
-                            particle_x = flame_x + flame_width - random.randint(0, 5)
-                            particle_y = flame_y + random.randint(0, flame_height)
-                            particle_color = random.choice([YELLOW, ORANGE, RED])
-                            particle_size = random.uniform(1, 3)
-                            particle_lifetime = random.randint(5, 15)
-                            self.projectile_particles.append((
-                                particle_x, particle_y, particle_color, 
-                                particle_size, particle_lifetime, 2, random.uniform(-0.5, 0.5)
-                            ))
+                # Draw jet flame chosen in update_animations (draw flames BEFORE player so they appear behind)
+                if self.player_flame is not None:
+                    flame_rect, flame_x, flame_y = self.player_flame
+                    self.screen.blit(self.flame_atlas, (flame_x, flame_y), flame_rect)
                 
                 # Draw current animation frame of player AFTER flame so player appears in front
                 player_frame = self.player_frames[self.player_frame_idx]
@@ -1359,29 +1714,18 @@ class RendererProcess:
             
             elif entity_type == EntityType.PLATFORM.value:
                 # We need to stretch the platform sprite to match the size
-                platform_surf = pygame.transform.scale(
-                    self.assets['platform'], 
-                    (width, height)
-                )
-                self.screen.blit(platform_surf, (x, y))
+                self.screen.blit(self.scaled_platform(width, height), (x, y))
                 
                 # Add glow effect for platform edges
-                glow_surf = pygame.Surface((width, 5), pygame.SRCALPHA)
-                for i in range(5):
-                    alpha = 150 - i * 30
-                    # Create proper RGBA color
-                    glow_color = (100, 200, 255, alpha)
-                    pygame.draw.rect(glow_surf, glow_color, (0, i, width, 1))
-                self.screen.blit(glow_surf, (x, y - 5))
+                self.screen.blit(self.platform_glow(width), (x, y - 5))
                 
                 # Draw debug visualization for platform reachability
                 if self.show_debug_info:
                     # Calculate maximum jump height
                     max_jump_height = (12 ** 2) / (2 * 0.5)  # Using JUMP_POWER=12, GRAVITY=0.5
                     
-                    # Get player position
-                    with self.player_position_lock:
-                        player_x, player_y = self.player_position[0], self.player_position[1]
+                    # Get player position (lockless read, see main.py)
+                    player_x, player_y = self.player_position[0], self.player_position[1]
                     
                     # Calculate if platform is potentially reachable from player's current position
                     vertical_dist = player_y - y  # Player y - platform y (remember y is downward)
@@ -1426,7 +1770,7 @@ class RendererProcess:
                     
                     # Display the vertical distance
                     dist_text = f"{int(vertical_dist)}"
-                    dist_surf = self.small_font.render(dist_text, True, (255, 255, 255))
+                    dist_surf = self.render_text(self.small_font, dist_text, (255, 255, 255))
                     self.screen.blit(dist_surf, (x + width/2 - dist_surf.get_width()/2, y - 20))
             
             elif entity_type == EntityType.ENEMY.value:
@@ -1480,29 +1824,15 @@ class RendererProcess:
                     health_pct = entity_health / max_health
                     bar_width = 30
                     current_width = int(bar_width * health_pct)
-                    pygame.draw.rect(self.screen, RED, (x + 5, y - 5, bar_width, 3))
-                    pygame.draw.rect(self.screen, GREEN, (x + 5, y - 5, current_width, 3))
+                    self.screen.fill(RED, (x + 5, y - 5, bar_width, 3))
+                    self.screen.fill(GREEN, (x + 5, y - 5, current_width, 3))
             
             elif entity_type == EntityType.PROJECTILE.value:
                 weapon_type = entity.get('weapon_type', 1)
                 
                 # Add a glowing effect to projectiles
                 glow_size = 20 if weapon_type == 1 else 30
-                glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                
-                # Create a radial gradient with color based on weapon type
-                if weapon_type == 1:
-                    # Blue glow for primary weapon
-                    glow_color = (100, 100, 255)
-                else:
-                    # Green glow for secondary weapon
-                    glow_color = (50, 255, 100)
-                
-                for radius in range(int(glow_size/2), 0, -1):
-                    alpha = int(150 * (radius / (glow_size/2)))
-                    # Create proper RGBA color
-                    final_glow_color = (glow_color[0], glow_color[1], glow_color[2], alpha)
-                    pygame.draw.circle(glow_surf, final_glow_color, (int(glow_size/2), int(glow_size/2)), radius)
+                glow_surf = self.projectile_glows[1 if weapon_type == 1 else 2]
                 
                 # Position the glow behind the projectile
                 glow_x = x - int(glow_size/2) + (5 if weapon_type == 1 else 7)
@@ -1512,124 +1842,156 @@ class RendererProcess:
                 # Draw the actual projectile
                 projectile_asset = self.assets[f'projectile{weapon_type}']
                 self.screen.blit(projectile_asset, (x, y))
-                
-                # Create particle trail based on weapon type
-                self.create_projectile_trail(x + (5 if weapon_type == 1 else 7), 
-                                            y + (5 if weapon_type == 1 else 7),
-                                            weapon_type)
             
             elif entity_type == EntityType.POWERUP.value:
                 powerup_type = entity.get('powerup_type', 1)
                 
-                # Add pulsing glow effect
-                pulse = (math.sin(pygame.time.get_ticks() * 0.01) + 1) * 0.5  # 0 to 1
-                glow_size = int(40 + 10 * pulse)
-                glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                
-                # Different colors for different powerups
                 if powerup_type == 1:  # Health
-                    glow_color = (0, 255, 0, 50)  # Already in RGBA format
                     powerup_frame = self.powerup1_frames[self.powerup1_frame_idx]
                 elif powerup_type == 2:  # Score
-                    glow_color = (255, 255, 0, 50)  # Already in RGBA format
                     powerup_frame = self.powerup2_frames[self.powerup2_frame_idx]
                 else:  # Invincibility
-                    glow_color = (0, 100, 255, 50)  # Already in RGBA format
                     powerup_frame = self.powerup3_frames[self.powerup3_frame_idx]
                 
-                pygame.draw.circle(glow_surf, glow_color, (glow_size // 2, glow_size // 2), glow_size // 2)
+                # Add pulsing glow effect from this type's pre-rendered glow sizes
+                glow_frames = self.powerup_glow_frames.get(powerup_type, self.powerup_glow_frames[3])
+                glow_surf = glow_frames[powerup_glow_idx]
+                glow_size = 40 + powerup_glow_idx
                 self.screen.blit(glow_surf, (x - (glow_size - 30) // 2, y - (glow_size - 30) // 2))
                 
                 # Draw the powerup with a hovering effect
-                hover_offset = int(math.sin(pygame.time.get_ticks() * 0.005) * 3)
                 self.screen.blit(powerup_frame, (x, y + hover_offset))
     
-    def draw_ui(self):
-        """Draw game UI elements"""
-        # Get current game state
-        with self.game_state_lock:
-            current_state = self.game_state.value
-        
-        # Don't draw UI on menu or game over screens
-        if current_state == GameState.MENU.value or current_state == GameState.GAME_OVER.value:
-            return
-        
-        # Draw score
-        with self.player_score_lock:
-            score_text = f"SCORE: {self.player_score.value}"
-        score_surface = self.main_font.render(score_text, True, WHITE)
-        self.screen.blit(score_surface, (20, 20))
-        
-        # Draw time survived
-        minutes = int(self.game_time) // 60
-        seconds = int(self.game_time) % 60
-        time_text = f"TIME: {minutes:02d}:{seconds:02d}"
-        time_surface = self.main_font.render(time_text, True, WHITE)
-        self.screen.blit(time_surface, (self.width // 2 - time_surface.get_width() // 2, 20))
-        
-        # Draw wave number and progress bar
-        wave_text = f"WAVE: {self.current_wave}"
-        wave_surface = self.main_font.render(wave_text, True, WHITE)
-        self.screen.blit(wave_surface, (self.width - wave_surface.get_width() - 20, 20))
-        
-        # Progress to next wave bar
-        progress_width = 200
-        progress_height = 15
-        progress_x = self.width - progress_width - 20
-        progress_y = 60
+    def create_process_info_panel(self, info_width, info_height, current_fps, avg_frame_time):
+        """Render the system metrics panel with its current values"""
+        # Semi-transparent panel with gradient, border and title; built on first use
+        if self.info_panel_surf is None:
+            self.info_panel_surf = self.create_info_panel(info_width, info_height)
         
-        # Draw progress bar background
-        pygame.draw.rect(self.screen, GRAY, (progress_x, progress_y, progress_width, progress_height))
-        
-        # Draw progress bar fill
-        progress_fill_width = int(self.wave_progress / 100 * progress_width)
+        # Metrics data in two columns
+        try:
+            queue_size = f"{self.logic_to_render_queue.qsize()}"
+        except NotImplementedError:
+            queue_size = "N/A (macOS)"
+
+        metrics = [
+            ("FPS", f"{current_fps:.1f}"),
+            ("Frame Time", f"{avg_frame_time*1000:.1f} ms"),
+            ("Entities", f"{len(self.entities)}"),
+            ("Particles", f"{len(self.projectile_particles) + len(self.explosion_particles)}"),
+            ("Queue Size", queue_size)
+        ]
         
-        # Color gradient based on progress
-        if self.wave_progress < 33:
-            bar_color = (255, 50, 50)  # Red
-        elif self.wave_progress < 66:
-            bar_color = (255, 255, 50)  # Yellow
-        else:
-            bar_color = (50, 255, 50)  # Green
+        # System metrics if available
+        try:
+            import psutil
+            process = psutil.Process()
+            memory_info = process.memory_info()
+            memory_mb = memory_info.rss / 1024 / 1024
+            cpu_percent = process.cpu_percent(interval=None) / psutil.cpu_count()
+            
+            metrics.extend([
+                ("Memory", f"{memory_mb:.1f} MB"),
+                ("CPU Usage", f"{cpu_percent:.1f}%")
+            ])
+        except (ImportError, AttributeError):
+            metrics.append(("Status", "No system metrics"))
+        
+        # The rows run past the bottom of the panel frame, so size the surface to fit them;
+        # BLEND_RGBA_MAX copies the translucent frame onto the empty surface unchanged
+        row_height = 32  # Further increase row height for better text visibility
+        header_height = 26
+        panel = pygame.Surface((info_width, max(info_height, 36 + header_height + len(metrics) * row_height)),
+                               pygame.SRCALPHA)
+        panel.blit(self.info_panel_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        
+        # Display info with improved styling and spacing
+        y_offset = 36
+        
+        # Draw table-like headers with color coding
+        header_colors = [LIGHT_BLUE, GREEN]
+        label_column_width = 150  # Increase label column width
+        value_column_width = 180  # Increase value column width
+        
+        # Column headers
+        panel.fill((40, 60, 100), (10, y_offset - 2, info_width - 20, header_height))
+        
+        metric_header = self.render_text(self.small_font, "Metric", header_colors[0])
+        value_header = self.render_text(self.small_font, "Value", header_colors[1])
+        
+        # Calculate vertical centers for headers
+        metric_y = y_offset + (header_height - metric_header.get_height()) // 2 - 2
+        value_y = y_offset + (header_height - value_header.get_height()) // 2 - 2
+        
+        panel.blit(metric_header, (20, metric_y))
+        panel.blit(value_header, (label_column_width + 20, value_y))
+        
+        y_offset += header_height
+        
+        # Add separator line between header and data rows
+        pygame.draw.line(panel, GRAY, 
+                        (10, y_offset - 1), 
+                        (info_width - 10, y_offset - 1))
+        
+        # Draw metrics with alternating row colors and proper spacing
+        for i, (label, value) in enumerate(metrics):
+            # Alternating row background, filled opaque like draw.rect did on the display
+            row_color = (30, 40, 60) if i % 2 == 0 else (20, 30, 50)
+            panel.fill(row_color, (10, y_offset, info_width - 20, row_height))
+            
+            # Label - left-aligned with proper truncation if needed
+            label_surf = self.render_text(self.small_font, label, LIGHT_BLUE)
+            # Calculate vertical center position for text
+            label_y = y_offset + (row_height - label_surf.get_height()) // 2
+            panel.blit(label_surf, (20, label_y))
+            
+            # Value - ensure it fits within the available space
+            # Calculate max allowed width for the value
+            max_value_width = info_width - label_column_width - 40
+            
+            # Render and check if it's too long
+            value_surf = self.render_text(self.small_font, value, WHITE)
+            if value_surf.get_width() > max_value_width:
+                # If too long, truncate or use smaller font
+                if len(value) > 15:
+                    # Truncate with ellipsis
+                    shortened_value = value[:12] + "..."
+                    value_surf = self.render_text(self.small_font, shortened_value, WHITE)
+                else:
+                    # Try with a smaller font
+                    value_surf = self.render_text(self.smaller_font, value, WHITE)
             
-        pygame.draw.rect(self.screen, bar_color, (progress_x, progress_y, progress_fill_width, progress_height))
-        
-        # Add wave progress text
-        progress_text = f"Next: {self.wave_progress}%"
-        progress_text_surf = self.small_font.render(progress_text, True, WHITE)
-        text_x = progress_x + (progress_width - progress_text_surf.get_width()) // 2
-        text_y = progress_y + progress_height + 5
-        self.screen.blit(progress_text_surf, (text_x, text_y))
-        
-        # Draw health bar
-        with self.player_health_lock:
-            health = self.player_health.value
-        
-        health_text = f"HEALTH: {health}"
-        health_surface = self.main_font.render(health_text, True, WHITE)
-        self.screen.blit(health_surface, (20, 60))
-        
-        # Health bar background
-        pygame.draw.rect(self.screen, GRAY, (20, 100, 200, 20))
-        # Health bar fill
-        health_width = int(health / 100 * 200)
-        if health > 60:
-            health_color = GREEN
-        elif health > 30:
-            health_color = YELLOW
-        else:
-            health_color = RED
-        pygame.draw.rect(self.screen, health_color, (20, 100, health_width, 20))
+            # Calculate vertical center position for value text
+            value_y = y_offset + (row_height - value_surf.get_height()) // 2
+            panel.blit(value_surf, (label_column_width + 20, value_y))
+            
+            y_offset += row_height
         
-        # Enhanced Controls Display
+        return panel.convert_alpha()
+    
+    def create_info_panel(self, info_width, info_height):
+        """Pre-render the static frame of the system metrics panel"""
+        # Semi-transparent panel with gradient
+        alphas = np.minimum(180, 160 + (np.arange(info_height) * 0.1).astype(int))
+        info_surface = vertical_gradient(info_width, info_height, (0, 10, 30), alphas)
+        
+        # Panel border with glow
+        pygame.draw.rect(info_surface, (100, 150, 255, 255), (0, 0, info_width, info_height), 2, border_radius=8)
+        
+        # Title bar for process info
+        pygame.draw.rect(info_surface, (80, 120, 220, 200), (2, 2, info_width-4, 26), border_radius=6)
+        title_text = "SYSTEM METRICS"
+        title_surf = self.render_text(self.small_font, title_text, WHITE)
+        info_surface.blit(title_surf, ((info_width - title_surf.get_width()) // 2, 6))
+        return info_surface.convert_alpha()
+    
+    def create_controls_bar(self):
+        """Pre-render the controls legend shown at the bottom of the screen; none of it changes during play"""
         controls_bg_height = 60
         controls_bg_width = 790  # Increase width from 750 to 950 to fully accommodate all controls
-        controls_bg_rect = pygame.Rect(
-            (self.width - controls_bg_width) // 2,
-            self.height - controls_bg_height - 10,
-            controls_bg_width,
-            controls_bg_height
-        )
+        # The bar sits 10 px above the bottom of the screen; the labels below the keys hang into that gap
+        bar = pygame.Surface((controls_bg_width, controls_bg_height + 10), pygame.SRCALPHA)
+        controls_bg_rect = pygame.Rect(0, 0, controls_bg_width, controls_bg_height)
         
         # Semi-transparent background with border
         controls_bg_surface = pygame.Surface((controls_bg_width, controls_bg_height), pygame.SRCALPHA)
@@ -1642,12 +2004,12 @@ class RendererProcess:
             pygame.draw.rect(controls_bg_surface, (150, 200, 255, alpha), 
                             (3, 3 + i, controls_bg_width - 6, 1), 0, border_radius=10)
         
-        self.screen.blit(controls_bg_surface, controls_bg_rect)
+        bar.blit(controls_bg_surface, controls_bg_rect)
         
         # Control Key Visualization
         key_size = 30
         key_margin = 8
-        key_y = self.height - controls_bg_height + 15
+        key_y = 25
         
         # Helper function to draw a key
         def draw_key(text, x_pos, color=LIGHT_BLUE, width=None):
@@ -1655,22 +2017,19 @@ class RendererProcess:
                 width = key_size
             
             # Key background with gradient
-            key_surf = pygame.Surface((width, key_size), pygame.SRCALPHA)
-            for y in range(key_size):
-                alpha = 200 - int(y * 3)
-                pygame.draw.line(key_surf, (*color[:3], alpha), (0, y), (width, y))
+            key_surf = vertical_gradient(width, key_size, color, 200 - np.arange(key_size) * 3)
             
             # Key border
             pygame.draw.rect(key_surf, (*color[:3], 255), (0, 0, width, key_size), 2, border_radius=4)
             
             # Key text
-            text_surf = self.small_font.render(text, True, WHITE)
+            text_surf = self.render_text(self.small_font, text, WHITE)
             key_surf.blit(text_surf, ((width - text_surf.get_width()) // 2, (key_size - text_surf.get_height()) // 2))
             
             # Add a highlight
             pygame.draw.line(key_surf, (255, 255, 255, 100), (3, 3), (width - 3, 3), 1)
             
-            self.screen.blit(key_surf, (x_pos, key_y))
+            bar.blit(key_surf, (x_pos, key_y))
             return x_pos + width + key_margin
         
         # Draw the arrow keys
@@ -1690,8 +2049,8 @@ class RendererProcess:
         
         # Movement Text
         move_x = start_x + 5
-        move_text = self.small_font.render("Move/Jump", True, WHITE)
-        self.screen.blit(move_text, (move_x, key_y + 7))
+        move_text = self.render_text(self.small_font, "Move/Jump", WHITE)
+        bar.blit(move_text, (move_x, key_y + 7))
         start_x = move_x + move_text.get_width() + 20
         
         # Attack Keys
@@ -1702,13 +2061,13 @@ class RendererProcess:
         
         # Attack Text
         attack_x = start_x + 5
-        attack_text = self.small_font.render("Attack", True, WHITE)
-        self.screen.blit(attack_text, (attack_x, key_y + 7))
+        attack_text = self.render_text(self.small_font, "Attack", WHITE)
+        bar.blit(attack_text, (attack_x, key_y + 7))
         
         # Weapon description in parentheses
         weapon_desc_y = key_y + 23  # Position below the main text
-        weapon_desc = self.small_font.render("(Rapid/Heavy)", True, (200, 200, 200))
-        self.screen.blit(weapon_desc, (attack_x, weapon_desc_y))
+        weapon_desc = self.render_text(self.small_font, "(Rapid/Heavy)", (200, 200, 200))
+        bar.blit(weapon_desc, (attack_x, weapon_desc_y))
         
         start_x = attack_x + attack_text.get_width() + 20
         
@@ -1717,8 +2076,8 @@ class RendererProcess:
         start_x = draw_key("ESC", start_x, color=YELLOW, width=45)
         
         # ESC Text
-        esc_text = self.small_font.render("Pause", True, WHITE)
-        self.screen.blit(esc_text, (start_x + 5, key_y + 7))
+        esc_text = self.render_text(self.small_font, "Pause", WHITE)
+        bar.blit(esc_text, (start_x + 5, key_y + 7))
         start_x = start_x + esc_text.get_width() + 15
         
         # P Key for process info
@@ -1726,8 +2085,8 @@ class RendererProcess:
         start_x = draw_key("P", start_x, color=PURPLE)
         
         # P Text
-        p_text = self.small_font.render("Info", True, WHITE)
-        self.screen.blit(p_text, (start_x + 5, key_y + 7))
+        p_text = self.render_text(self.small_font, "Info", WHITE)
+        bar.blit(p_text, (start_x + 5, key_y + 7))
         start_x = start_x + p_text.get_width() + 15
         
         # D Key for debug visualization
@@ -1735,8 +2094,8 @@ class RendererProcess:
         start_x = draw_key("D", start_x, color=(0, 180, 0))
         
         # D Text
-        d_text = self.small_font.render("Debug", True, WHITE)
-        self.screen.blit(d_text, (start_x + 5, key_y + 7))
+        d_text = self.render_text(self.small_font, "Debug", WHITE)
+        bar.blit(d_text, (start_x + 5, key_y + 7))
         start_x = start_x + d_text.get_width() + 15
         
         # Q Key for quitting
@@ -1744,20 +2103,99 @@ class RendererProcess:
         start_x = draw_key("Q", start_x, color=RED)
         
         # Q Text
-        q_text = self.small_font.render("Quit", True, WHITE)
-        self.screen.blit(q_text, (start_x + 5, key_y + 7))
+        q_text = self.render_text(self.small_font, "Quit", WHITE)
+        bar.blit(q_text, (start_x + 5, key_y + 7))
+        
+        return bar.convert_alpha()
+    
+    def draw_ui(self):
+        """Draw game UI elements"""
+        current_state = self.frame_state
+        
+        # Don't draw UI on menu or game over screens
+        if current_state == GameState.MENU.value or current_state == GameState.GAME_OVER.value:
+            return
+        
+        # Draw score
+        score_text = f"SCORE: {self.player_score.value}"
+        score_surface = self.render_text(self.main_font, score_text, WHITE)
+        self.screen.blit(score_surface, (20, 20))
+        
+        # Draw time survived
+        minutes = int(self.game_time) // 60
+        seconds = int(self.game_time) % 60
+        time_text = f"TIME: {minutes:02d}:{seconds:02d}"
+        time_surface = self.render_text(self.main_font, time_text, WHITE)
+        self.screen.blit(time_surface, (self.width // 2 - time_surface.get_width() // 2, 20))
+        
+        # Draw wave number and progress bar
+        wave_text = f"WAVE: {self.current_wave}"
+        wave_surface = self.render_text(self.main_font, wave_text, WHITE)
+        self.screen.blit(wave_surface, (self.width - wave_surface.get_width() - 20, 20))
+        
+        # Progress to next wave bar
+        progress_width = 200
+        progress_height = 15
+        progress_x = self.width - progress_width - 20
+        progress_y = 60
+        
+        # Draw progress bar background
+        self.screen.blit(self.solid_surface((progress_width, progress_height), GRAY), (progress_x, progress_y))
+        
+        # Draw progress bar fill
+        progress_fill_width = int(self.wave_progress / 100 * progress_width)
+        
+        # Color gradient based on progress
+        if self.wave_progress < 33:
+            bar_color = (255, 50, 50)  # Red
+        elif self.wave_progress < 66:
+            bar_color = (255, 255, 50)  # Yellow
+        else:
+            bar_color = (50, 255, 50)  # Green
+            
+        self.screen.blit(self.solid_surface((progress_width, progress_height), bar_color), (progress_x, progress_y),
+                         (0, 0, progress_fill_width, progress_height))
+        
+        # Add wave progress text
+        progress_text = f"Next: {self.wave_progress}%"
+        progress_text_surf = self.render_text(self.small_font, progress_text, WHITE)
+        text_x = progress_x + (progress_width - progress_text_surf.get_width()) // 2
+        text_y = progress_y + progress_height + 5
+        self.screen.blit(progress_text_surf, (text_x, text_y))
+        
+        # Draw health bar
+        health = self.player_health.value
+        
+        health_text = f"HEALTH: {health}"
+        health_surface = self.render_text(self.main_font, health_text, WHITE)
+        self.screen.blit(health_surface, (20, 60))
+        
+        # Health bar background
+        self.screen.blit(self.solid_surface((200, 20), GRAY), (20, 100))
+        # Health bar fill
+        health_width = int(health / 100 * 200)
+        if health > 60:
+            health_color = GREEN
+        elif health > 30:
+            health_color = YELLOW
+        else:
+            health_color = RED
+        self.screen.blit(self.solid_surface((200, 20), health_color), (20, 100), (0, 0, health_width, 20))
+        
+        # Enhanced Controls Display, rendered once by create_controls_bar
+        self.screen.blit(self.controls_bar, ((self.width - self.controls_bar.get_width()) // 2,
+                                             self.height - self.controls_bar.get_height()))
         
         # If paused, show pause icon
         if current_state == GameState.PAUSED.value:
             pause_text = "PAUSED"
-            pause_surface = self.main_font.render(pause_text, True, WHITE)
+            pause_surface = self.render_text(self.main_font, pause_text, WHITE)
             text_width = pause_surface.get_width()
             
-            # Background rectangle
-            pygame.draw.rect(self.screen, (0, 0, 0, 150), 
-                             (self.width // 2 - text_width // 2 - 20, 
-                              self.height // 2 - 30, 
-                              text_width + 40, 60))
+            # Background rectangle (opaque; the display surface has no alpha channel)
+            self.screen.fill(BLACK, (self.width // 2 - text_width // 2 - 20, 
+                                     self.height // 2 - 30, 
+                                     text_width + 40, 60))
             
             # Text
             self.screen.blit(pause_surface, 
@@ -1783,135 +2221,19 @@ class RendererProcess:
             info_height = 270  # Increase height to accommodate taller rows
             info_bg_rect = pygame.Rect(self.width - info_width - 20, 60, info_width, info_height)
             
-            # Semi-transparent panel with gradient
-            info_surface = pygame.Surface((info_width, info_height), pygame.SRCALPHA)
-            for y in range(info_height):
-                alpha = min(180, 160 + int(y * 0.1))
-                pygame.draw.line(info_surface, (0, 10, 30, alpha), (0, y), (info_width, y))
-            
-            # Panel border with glow
-            pygame.draw.rect(info_surface, (100, 150, 255, 255), (0, 0, info_width, info_height), 2, border_radius=8)
-            
-            # Title bar for process info
-            pygame.draw.rect(info_surface, (80, 120, 220, 200), (2, 2, info_width-4, 26), border_radius=6)
-            title_text = "SYSTEM METRICS"
-            title_surf = self.small_font.render(title_text, True, WHITE)
-            info_surface.blit(title_surf, ((info_width - title_surf.get_width()) // 2, 6))
-            
-            self.screen.blit(info_surface, info_bg_rect)
-            
-            # Display info with improved styling and spacing
-            y_offset = info_bg_rect.y + 36
-            
-            # Draw table-like headers with color coding
-            header_colors = [LIGHT_BLUE, GREEN]
-            label_column_width = 150  # Increase label column width
-            value_column_width = 180  # Increase value column width
-            
-            # Column headers
-            header_height = 26
-            pygame.draw.rect(self.screen, (40, 60, 100, 180), 
-                           (info_bg_rect.x + 10, y_offset - 2, info_width - 20, header_height))
-            
-            metric_header = self.small_font.render("Metric", True, header_colors[0])
-            value_header = self.small_font.render("Value", True, header_colors[1])
-            
-            # Calculate vertical centers for headers
-            metric_y = y_offset + (header_height - metric_header.get_height()) // 2 - 2
-            value_y = y_offset + (header_height - value_header.get_height()) // 2 - 2
-            
-            self.screen.blit(metric_header, (info_bg_rect.x + 20, metric_y))
-            self.screen.blit(value_header, (info_bg_rect.x + label_column_width + 20, value_y))
-            
-            y_offset += header_height
-            
-            # Add separator line between header and data rows
-            pygame.draw.line(self.screen, GRAY, 
-                            (info_bg_rect.x + 10, y_offset - 1), 
-                            (info_bg_rect.x + info_width - 10, y_offset - 1))
-            
-            # Metrics data in two columns
-            try:
-                queue_size = f"{self.logic_to_render_queue.qsize()}"
-            except NotImplementedError:
-                queue_size = "N/A (macOS)"
-
-            metrics = [
-                ("FPS", f"{current_fps:.1f}"),
-                ("Frame Time", f"{avg_frame_time*1000:.1f} ms"),
-                ("Entities", f"{len(self.entities)}"),
-                ("Particles", f"{len(self.projectile_particles) + len(self.explosion_particles)}"),
-                ("Queue Size", queue_size)
-            ]
-            
-            # System metrics if available
-            try:
-                import psutil
-                process = psutil.Process()
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024
-                cpu_percent = process.cpu_percent(interval=None) / psutil.cpu_count()
-                
-                metrics.extend([
-                    ("Memory", f"{memory_mb:.1f} MB"),
-                    ("CPU Usage", f"{cpu_percent:.1f}%")
-                ])
-            except (ImportError, AttributeError):
-                metrics.append(("Status", "No system metrics"))
-            
-            # Draw metrics with alternating row colors and proper spacing
-            row_height = 32  # Further increase row height for better text visibility
-            for i, (label, value) in enumerate(metrics):
-                # Alternating row background
-                row_color = (30, 40, 60, 100) if i % 2 == 0 else (20, 30, 50, 100)
-                pygame.draw.rect(self.screen, row_color, 
-                                (info_bg_rect.x + 10, y_offset, info_width - 20, row_height))
-                
-                # Label - left-aligned with proper truncation if needed
-                label_surf = self.small_font.render(label, True, LIGHT_BLUE)
-                # Calculate vertical center position for text
-                label_y = y_offset + (row_height - label_surf.get_height()) // 2
-                self.screen.blit(label_surf, (info_bg_rect.x + 20, label_y))
-                
-                # Value - ensure it fits within the available space
-                # Calculate max allowed width for the value
-                max_value_width = info_width - label_column_width - 40
-                
-                # Render and check if it's too long
-                value_surf = self.small_font.render(value, True, WHITE)
-                if value_surf.get_width() > max_value_width:
-                    # If too long, truncate or use smaller font
-                    if len(value) > 15:
-                        # Truncate with ellipsis
-                        shortened_value = value[:12] + "..."
-                        value_surf = self.small_font.render(shortened_value, True, WHITE)
-                    else:
-                        # Try with a smaller font
-                        smaller_font = pygame.font.SysFont('Arial', SMALL_FONT_SIZE - 2)
-                        value_surf = smaller_font.render(value, True, WHITE)
-                
-                # Calculate vertical center position for value text
-                value_y = y_offset + (row_height - value_surf.get_height()) // 2
-                self.screen.blit(value_surf, (info_bg_rect.x + label_column_width + 20, value_y))
-                
-                y_offset += row_height
+            # Rebuild the panel at most every INFO_PANEL_INTERVAL; the metrics don't change meaningfully faster
+            if self.process_info_surf is None or current_time - self.process_info_time >= INFO_PANEL_INTERVAL:
+                self.process_info_surf = self.create_process_info_panel(info_width, info_height,
+                                                                        current_fps, avg_frame_time)
+                self.process_info_time = current_time
+            self.screen.blit(self.process_info_surf, info_bg_rect)
     
-    def draw_menu(self):
-        """Draw the game menu screen"""
-        # Opaque overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Title
-        title_text = "ALIEN INVASION"
-        title_surf = pygame.font.SysFont('Arial', 72, bold=True).render(title_text, True, LIGHT_BLUE)
-        self.screen.blit(title_surf, (self.width//2 - title_surf.get_width()//2, 150))
-        
-        # Subtitle
-        subtitle_text = "A Game about Operating System Concepts"
-        subtitle_surf = self.main_font.render(subtitle_text, True, WHITE)
-        self.screen.blit(subtitle_surf, (self.width//2 - subtitle_surf.get_width()//2, 230))
+    def create_menu_blits(self):
+        """Static menu text as centered (surface, position) pairs"""
+        lines = [
+            (self.banner_font, "ALIEN INVASION", LIGHT_BLUE, 150),  # Title
+            (self.main_font, "A Game about Operating System Concepts", WHITE, 230)  # Subtitle
+        ]
         
         # Instructions
         instructions = [
@@ -1922,100 +2244,197 @@ class RendererProcess:
             "ESC: Pause",
             "P: Toggle process info display",
             "D: Toggle platform reachability visualization",
-            "Q: Quit game",
-            "",
-            "Press SPACE to Start"
+            "Q: Quit game"
         ]
+        for i, instruction in enumerate(instructions):
+            lines.append((self.small_font, instruction, WHITE, 350 + i * 30))
         
-        y_pos = 350
-        for instruction in instructions:
-            if instruction == "Press SPACE to Start":
-                # Make it pulse
-                pulse = math.sin(pygame.time.get_ticks() * 0.005) * 0.3 + 0.7
-                color = (int(255 * pulse), int(255 * pulse), int(100 * pulse))
-                text_surf = self.main_font.render(instruction, True, color)
-                y_pos += 30  # Extra space before start prompt
-            else:
-                text_surf = self.small_font.render(instruction, True, WHITE)
-            
-            self.screen.blit(text_surf, (self.width//2 - text_surf.get_width()//2, y_pos))
-            y_pos += 30
+        return [self.centered_text(font, text, color, y) for font, text, color, y in lines]
+    
+    def create_modal_backdrop(self, overlay_color, blits):
+        """Full-screen overlay of overlay_color with the (surface, position) pairs drawn on it
+        
+        The text is composed with premultiplied alpha, which blends it onto the translucent
+        overlay the same way drawing both onto the screen in turn would, then converted
+        back to straight alpha so the backdrop draws with a plain (faster) alpha blit.
+        """
+        backdrop = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+        backdrop.fill(overlay_color)
+        backdrop = backdrop.premul_alpha()
+        for surf, pos in blits:
+            backdrop.blit(surf.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        # Un-premultiply; every pixel has at least the overlay's alpha, so there's no division by zero
+        alpha = pygame.surfarray.pixels_alpha(backdrop)[..., np.newaxis].astype(np.uint16)
+        rgb = pygame.surfarray.pixels3d(backdrop)
+        rgb[:] = (rgb.astype(np.uint16) * 255 + alpha // 2) // alpha
+        del rgb
+        return backdrop
+    
+    def draw_modal_screen(self, backdrop, static_blits, prompts):
+        """Draw a full-screen modal: its prebuilt backdrop, static (surface, position) pairs,
+        then the pulsing prompts given as (text, y), whose areas are kept in pulse_rects"""
+        self.screen.blit(backdrop, (0, 0))
+        # Surface.blits batches the calls; fblits is pygame-ce only and absent from pygame 2.5.2
+        self.screen.blits(static_blits, doreturn=False)
+        
+        step = pulse_step(self.frame_ticks)
+        pulse_blits = []
+        for text, y in prompts:
+            surf, x = self.pulse_text(text, step)
+            pulse_blits.append((surf, (x, y)))
+        self.pulse_rects = self.screen.blits(pulse_blits)
+    
+    def draw_menu(self):
+        """Draw the game menu screen"""
+        # Title, subtitle and controls, with the start prompt one blank line below the controls
+        self.draw_modal_screen(self.menu_screen, [], [("Press SPACE to Start", 650)])
     
     def draw_game_over(self):
         """Draw the game over screen"""
-        # Opaque overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Title
-        title_text = "GAME OVER"
-        title_surf = pygame.font.SysFont('Arial', 72, bold=True).render(title_text, True, RED)
-        self.screen.blit(title_surf, (self.width//2 - title_surf.get_width()//2, 150))
-        
-        # Score
-        with self.player_score_lock:
-            score = self.player_score.value
-        
-        score_text = f"FINAL SCORE: {score}"
-        score_surf = self.main_font.render(score_text, True, WHITE)
-        self.screen.blit(score_surf, (self.width//2 - score_surf.get_width()//2, 250))
-        
-        # Wave reached
-        wave_text = f"WAVE REACHED: {self.current_wave}"
-        wave_surf = self.main_font.render(wave_text, True, WHITE)
-        self.screen.blit(wave_surf, (self.width//2 - wave_surf.get_width()//2, 300))
-        
-        # Survival time
-        minutes = int(self.game_time) // 60
-        seconds = int(self.game_time) % 60
-        time_text = f"SURVIVAL TIME: {minutes:02d}:{seconds:02d}"
-        time_surf = self.main_font.render(time_text, True, WHITE)
-        self.screen.blit(time_surf, (self.width//2 - time_surf.get_width()//2, 350))
-        
-        # Instructions - with pulse effect
-        pulse = math.sin(pygame.time.get_ticks() * 0.005) * 0.3 + 0.7
-        color = (int(255 * pulse), int(255 * pulse), int(100 * pulse))
+        # Score, wave reached and survival time, rendered again only if the score or wave changes
+        score = self.player_score.value
+        key = (score, self.current_wave)
+        changed = key != self.game_over_key
+        if changed:
+            old_lines = self.game_over_lines
+            survived = self.final_time
+            self.game_over_lines = [
+                self.centered_text(self.main_font, f"FINAL SCORE: {score}", WHITE, 250),
+                self.centered_text(self.main_font, f"WAVE REACHED: {self.current_wave}", WHITE, 300),
+                self.centered_text(self.main_font, f"SURVIVAL TIME: {survived // 60:02d}:{survived % 60:02d}",
+                                   WHITE, 350)
+            ]
+            self.game_over_key = key
         
-        instructions = [
-            "Press SPACE to Restart",
-            "Press ESC or Q to Quit"
-        ]
+        # Title and results, with pulsing instructions below
+        self.draw_modal_screen(self.game_over_screen, self.game_over_lines,
+                               [("Press SPACE to Restart", 430), ("Press ESC or Q to Quit", 480)])
         
-        y_pos = 430
-        for instruction in instructions:
-            text_surf = self.main_font.render(instruction, True, color)
-            self.screen.blit(text_surf, (self.width//2 - text_surf.get_width()//2, y_pos))
-            y_pos += 50
+        if changed:
+            # The display update over a frozen frame must also replace the old result text
+            self.pulse_rects += [pygame.Rect(pos, surf.get_size()) for surf, pos in old_lines + self.game_over_lines]
     
     def draw_pause_screen(self):
         """Draw the pause screen overlay"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 30, 180))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Main pause text
-        pause_text = "PAUSED"
-        pause_surf = pygame.font.SysFont('Arial', 72, bold=True).render(pause_text, True, WHITE)
-        self.screen.blit(pause_surf, (self.width//2 - pause_surf.get_width()//2, 200))
-        
-        # Simple resume instructions
-        resume_text = "Press ESC to Resume"
-        resume_surf = self.main_font.render(resume_text, True, WHITE)
-        
-        # Add a pulsing effect to make it more visible
-        pulse = math.sin(pygame.time.get_ticks() * 0.005) * 0.3 + 0.7
-        pulse_color = (int(255 * pulse), int(255 * pulse), int(100 * pulse))
-        resume_surf_pulse = self.main_font.render(resume_text, True, pulse_color)
-        
-        # Quit instructions
-        quit_text = "Press Q to Quit"
-        quit_surf_pulse = self.main_font.render(quit_text, True, pulse_color)
-        
-        # Position at the center of the screen
-        self.screen.blit(resume_surf_pulse, (self.width//2 - resume_surf_pulse.get_width()//2, 300))
-        self.screen.blit(quit_surf_pulse, (self.width//2 - quit_surf_pulse.get_width()//2, 350))
+        # Main pause text, with pulsing resume and quit instructions to make them more visible
+        self.draw_modal_screen(self.pause_screen, [],
+                               [("Press ESC to Resume", 300), ("Press Q to Quit", 350)])
+    
+    def draw_effects(self, current_time):
+        """Draw the wave and powerup messages and the powerup pickup rings over the game"""
+        # Draw wave message if active
+        if self.wave_message and current_time < self.wave_message_end_time:
+            # Semi-transparent background
+            message_surf = self.render_text(self.title_font, self.wave_message['text'], YELLOW)
+            message_width = message_surf.get_width() + 80
+            message_height = message_surf.get_height() + 40
+            
+            # Calculate remaining display time
+            time_remaining = self.wave_message_end_time - current_time
+            alpha = min(255, int(time_remaining * 255 / self.wave_message['duration']))
+            
+            # Create overlay with alpha based on remaining time
+            overlay = pygame.Surface((message_width, message_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, min(150, alpha)))
+            
+            # Draw message box
+            message_rect = pygame.Rect(
+                (self.width - message_width) // 2,
+                (self.height - message_height) // 2,
+                message_width,
+                message_height
+            )
+            self.screen.blit(overlay, message_rect)
+            pygame.draw.rect(self.screen, YELLOW, message_rect, 3)
+            
+            # Draw message text
+            glow_size = 3
+            for dx in range(-glow_size, glow_size + 1):
+                for dy in range(-glow_size, glow_size + 1):
+                    if dx != 0 or dy != 0:
+                        distance = (dx**2 + dy**2) ** 0.5
+                        if distance <= glow_size:
+                            glow_alpha = int((1 - distance/glow_size) * 128)
+                            glow_color = (255, 255, 0, glow_alpha)
+                            glow_surf = self.render_text(self.title_font, self.wave_message['text'], glow_color)
+                            self.screen.blit(glow_surf, (message_rect.centerx - glow_surf.get_width()//2 + dx,
+                                                     message_rect.centery - glow_surf.get_height()//2 + dy))
+            
+            # Draw actual text on top of glow
+            self.screen.blit(message_surf, (message_rect.centerx - message_surf.get_width()//2,
+                                        message_rect.centery - message_surf.get_height()//2))
+        
+        # Draw powerup pickup animation rings
+        for ring in self.powerup_pickup_animation:
+            # Ensure color is valid
+            if isinstance(ring['color'], tuple) and len(ring['color']) >= 3:
+                ring_color_rgb = ring['color'][:3]  # Take just RGB components
+            else:
+                # Fallback to white if color is invalid
+                ring_color_rgb = (255, 255, 255)
+            
+            # Draw the expanding ring, fading the cached outline with its surface alpha
+            radius = int(ring['radius'])
+            ring_surf = self.get_circle(radius, tuple(ring_color_rgb), 2)
+            ring_surf.set_alpha(ring['alpha'])
+            self.screen.blit(ring_surf, (ring['x'] - radius, ring['y'] - radius))
+        
+        # Draw powerup message if active
+        if self.powerup_message and current_time < self.powerup_message_end_time:
+            # Get color - ensure it's a proper tuple
+            if isinstance(self.powerup_message['color'], tuple) and len(self.powerup_message['color']) >= 3:
+                text_color = self.powerup_message['color'][:3]  # Take just RGB components
+            else:
+                # Fallback to white if color is invalid
+                text_color = (255, 255, 255)
+            
+            # Create a smaller message box for powerups
+            message_surf = self.render_text(self.main_font, self.powerup_message['text'], text_color)
+            message_width = message_surf.get_width() + 40
+            message_height = message_surf.get_height() + 20
+            
+            # Calculate remaining display time for fade effect
+            time_remaining = self.powerup_message_end_time - current_time
+            alpha = min(255, int(time_remaining * 255 / self.powerup_message['duration']))
+            
+            # Create overlay with alpha
+            overlay = pygame.Surface((message_width, message_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, min(150, alpha)))
+            
+            # Position in top-center of screen
+            message_rect = pygame.Rect(
+                (self.width - message_width) // 2,
+                80,  # Position below the score/health UI
+                message_width,
+                message_height
+            )
+            self.screen.blit(overlay, message_rect)
+            
+            # Draw border with the text color
+            pygame.draw.rect(self.screen, text_color, message_rect, 2)
+            
+            # Add a simple glow effect - without using unpacking which can cause issues
+            glow_surf = pygame.Surface((message_width+4, message_height+4), pygame.SRCALPHA)
+            for i in range(3):
+                glow_alpha = int(alpha * (3-i) / 3)
+                # Create RGBA color manually
+                glow_color = (text_color[0], text_color[1], text_color[2], glow_alpha)
+                pygame.draw.rect(glow_surf, glow_color, (i, i, message_width-i*2, message_height-i*2), 1)
+            self.screen.blit(glow_surf, (message_rect.x-2, message_rect.y-2))
+            
+            # Draw text with alpha based on remaining time
+            text_surf = pygame.Surface(message_surf.get_size(), pygame.SRCALPHA)
+            text_surf.blit(message_surf, (0, 0))
+            text_surf.set_alpha(alpha)
+            self.screen.blit(text_surf, (message_rect.centerx - message_surf.get_width()//2,
+                                     message_rect.centery - message_surf.get_height()//2))
+    
+    def clear_effects(self):
+        """Drop any showing messages and pickup rings"""
+        self.wave_message = None
+        self.powerup_message = None
+        self.powerup_pickup_animation = []
     
     def run(self):
         """Main rendering loop"""
@@ -2025,36 +2444,77 @@ class RendererProcess:
         previous_state = None
         
         while running:
+            # Sample the clock once; everything drawn this frame animates from the same instant
+            self.frame_ticks = pygame.time.get_ticks()
+            
+            # Get current game state; the one locked read serves every check this frame
+            with self.game_state_lock:
+                self.frame_state = self.game_state.value
+            current_state = self.frame_state
+            
             # Handle events
             self.handle_events()
             
             # Receive updated game state from logic process
             self.receive_game_state()
             
-            # Get current game state
-            with self.game_state_lock:
-                current_state = self.game_state.value
-                
+            current_time = time.time()
+            
             # Detect state transitions
             if previous_state != current_state:
                 # Play game over sound when transitioning to game over state
                 if current_state == GameState.GAME_OVER.value and 'game_over' in self.sounds:
                     self.sounds['game_over'].play()
+                if current_state == GameState.GAME_OVER.value:
+                    # The logic process keeps counting game time; show the time the game ended
+                    self.final_time = int(self.game_time)
+                    self.game_over_key = None
+                elif current_state == GameState.MENU.value:
+                    # Effects don't animate behind the menu
+                    self.clear_effects()
+                elif current_state == GameState.PAUSED.value:
+                    self.pause_started = current_time
+                if previous_state == GameState.PAUSED.value:
+                    # Messages resume where they stopped instead of running out while paused
+                    paused_for = current_time - self.pause_started
+                    self.wave_message_end_time += paused_for
+                    self.powerup_message_end_time += paused_for
                 # Track the new state
                 previous_state = current_state
+                self.frozen_frame = None
             
-            # Clear screen and draw background
-            self.screen.fill(BLACK)
-            self.draw_background()
-            
-            # Update animations
-            self.update_animations()
-            
-            # Draw game entities
-            self.draw_entities()
-            
-            # Draw UI elements
-            self.draw_ui()
+            # Paused and game over frames show the game as it was when the state was entered
+            frozen = current_state == GameState.PAUSED.value or current_state == GameState.GAME_OVER.value
+            static_frame = frozen and self.frozen_frame is not None
+            if static_frame:
+                self.screen.blit(self.frozen_frame, (0, 0))
+            else:
+                # Advance the background by the length of the previous frame
+                self.update_background(self.frame_dt)
+                
+                # Draw background; its opaque base covers the window, so only clear any margins beyond it
+                for rect in self.background_margins:
+                    self.screen.fill(BLACK, rect)
+                self.draw_background()
+                
+                # The menu covers the game, so it only needs the background
+                if current_state != GameState.MENU.value:
+                    # Update animations
+                    self.update_animations()
+                    
+                    # Draw game entities
+                    self.draw_entities()
+                    
+                    # Draw UI elements
+                    self.draw_ui()
+                    
+                    if current_state == GameState.GAME_OVER.value:
+                        # Bake the messages and pickup rings into the final frame, since they
+                        # can't animate while it is shown
+                        self.draw_effects(current_time)
+                        self.clear_effects()
+                    if frozen:
+                        self.frozen_frame = self.screen.copy()
             
             # Draw game state screens
             if current_state == GameState.MENU.value:
@@ -2064,120 +2524,28 @@ class RendererProcess:
             elif current_state == GameState.PAUSED.value:
                 self.draw_pause_screen()
             
-            # Draw wave message if active
-            current_time = time.time()
-            if self.wave_message and current_time < self.wave_message_end_time:
-                # Semi-transparent background
-                message_surf = self.title_font.render(self.wave_message['text'], True, YELLOW)
-                message_width = message_surf.get_width() + 80
-                message_height = message_surf.get_height() + 40
-                
-                # Calculate remaining display time
-                time_remaining = self.wave_message_end_time - current_time
-                alpha = min(255, int(time_remaining * 255 / self.wave_message['duration']))
-                
-                # Create overlay with alpha based on remaining time
-                overlay = pygame.Surface((message_width, message_height), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, min(150, alpha)))
-                
-                # Draw message box
-                message_rect = pygame.Rect(
-                    (self.width - message_width) // 2,
-                    (self.height - message_height) // 2,
-                    message_width,
-                    message_height
-                )
-                self.screen.blit(overlay, message_rect)
-                pygame.draw.rect(self.screen, YELLOW, message_rect, 3)
-                
-                # Draw message text
-                glow_size = 3
-                for dx in range(-glow_size, glow_size + 1):
-                    for dy in range(-glow_size, glow_size + 1):
-                        if dx != 0 or dy != 0:
-                            distance = (dx**2 + dy**2) ** 0.5
-                            if distance <= glow_size:
-                                glow_alpha = int((1 - distance/glow_size) * 128)
-                                glow_color = (255, 255, 0, glow_alpha)
-                                glow_surf = self.title_font.render(self.wave_message['text'], True, glow_color)
-                                self.screen.blit(glow_surf, (message_rect.centerx - glow_surf.get_width()//2 + dx,
-                                                         message_rect.centery - glow_surf.get_height()//2 + dy))
-                
-                # Draw actual text on top of glow
-                self.screen.blit(message_surf, (message_rect.centerx - message_surf.get_width()//2,
-                                            message_rect.centery - message_surf.get_height()//2))
-            
-            # Draw powerup pickup animation rings
-            for ring in self.powerup_pickup_animation:
-                # Ensure color is valid
-                if isinstance(ring['color'], tuple) and len(ring['color']) >= 3:
-                    ring_color_rgb = ring['color'][:3]  # Take just RGB components
-                else:
-                    # Fallback to white if color is invalid
-                    ring_color_rgb = (255, 255, 255)
-                
-                # Draw the expanding ring with alpha
-                ring_surf = pygame.Surface((ring['radius']*2, ring['radius']*2), pygame.SRCALPHA)
-                # Create RGBA color manually 
-                ring_color = (ring_color_rgb[0], ring_color_rgb[1], ring_color_rgb[2], ring['alpha'])
-                pygame.draw.circle(ring_surf, ring_color, (ring['radius'], ring['radius']), ring['radius'], 2)
-                self.screen.blit(ring_surf, (ring['x'] - ring['radius'], ring['y'] - ring['radius']))
-            
-            # Draw powerup message if active
-            if self.powerup_message and current_time < self.powerup_message_end_time:
-                # Get color - ensure it's a proper tuple
-                if isinstance(self.powerup_message['color'], tuple) and len(self.powerup_message['color']) >= 3:
-                    text_color = self.powerup_message['color'][:3]  # Take just RGB components
-                else:
-                    # Fallback to white if color is invalid
-                    text_color = (255, 255, 255)
-                
-                # Create a smaller message box for powerups
-                message_surf = self.main_font.render(self.powerup_message['text'], True, text_color)
-                message_width = message_surf.get_width() + 40
-                message_height = message_surf.get_height() + 20
-                
-                # Calculate remaining display time for fade effect
-                time_remaining = self.powerup_message_end_time - current_time
-                alpha = min(255, int(time_remaining * 255 / self.powerup_message['duration']))
-                
-                # Create overlay with alpha
-                overlay = pygame.Surface((message_width, message_height), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, min(150, alpha)))
-                
-                # Position in top-center of screen
-                message_rect = pygame.Rect(
-                    (self.width - message_width) // 2,
-                    80,  # Position below the score/health UI
-                    message_width,
-                    message_height
-                )
-                self.screen.blit(overlay, message_rect)
-                
-                # Draw border with the text color
-                pygame.draw.rect(self.screen, text_color, message_rect, 2)
-                
-                # Add a simple glow effect - without using unpacking which can cause issues
-                glow_surf = pygame.Surface((message_width+4, message_height+4), pygame.SRCALPHA)
-                for i in range(3):
-                    glow_alpha = int(alpha * (3-i) / 3)
-                    # Create RGBA color manually
-                    glow_color = (text_color[0], text_color[1], text_color[2], glow_alpha)
-                    pygame.draw.rect(glow_surf, glow_color, (i, i, message_width-i*2, message_height-i*2), 1)
-                self.screen.blit(glow_surf, (message_rect.x-2, message_rect.y-2))
-                
-                # Draw text with alpha based on remaining time
-                text_surf = pygame.Surface(message_surf.get_size(), pygame.SRCALPHA)
-                text_surf.blit(message_surf, (0, 0))
-                text_surf.set_alpha(alpha)
-                self.screen.blit(text_surf, (message_rect.centerx - message_surf.get_width()//2,
-                                         message_rect.centery - message_surf.get_height()//2))
+            # Messages and pickup rings; at game over they are part of frozen_frame, and
+            # while paused they are left out and carry on after resuming
+            if not frozen:
+                self.draw_effects(current_time)
+            
+            # Update display. While playing every pixel changes each frame (twinkling stars, three
+            # parallax layers drifting at different speeds over pulsing nebulas), so a dirty-rect
+            # update(rects) or screen.scroll() would cover the whole window anyway. Over a frozen
+            # frame only the areas the modal screen lists in pulse_rects change
+            if static_frame:
+                pygame.display.update(self.pulse_rects)
+            else:
+                pygame.display.flip()
             
-            # Update display
-            pygame.display.flip()
+            # Sleep through most of the remaining frame budget (SDL_Delay) so the logic process
+            # gets the CPU, leaving the last millisecond to clock.tick
+            sleep_ms = FRAME_MS - (pygame.time.get_ticks() - self.frame_ticks) - 1
+            if sleep_ms > 0:
+                pygame.time.wait(sleep_ms)
             
-            # Cap to 60 FPS
-            self.clock.tick(FPS) 
+            # Cap to 60 FPS; clamp the measured step so a hitch doesn't make the background jump
+            self.frame_dt = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_DT)
     
     def create_powerup_pickup_animation(self, x, y, powerup_type=1):
         """Create a special animation effect when a powerup is collected"""
@@ -2208,18 +2576,16 @@ class RendererProcess:
             })
         
         # Create rising particles
-        for _ in range(20):
-            angle = random.random() * math.pi * 2
-            speed = random.uniform(0.5, 2.0)
-            dx = math.cos(angle) * speed * 0.5
-            dy = -speed * 2  # Always rise up
-            size = random.uniform(2, 5)
-            lifetime = random.randint(30, 60)
-            
-            # Add some variation to color
-            r = min(255, max(0, color[0] + random.randint(-20, 20)))
-            g = min(255, max(0, color[1] + random.randint(-20, 20)))
-            b = min(255, max(0, color[2] + random.randint(-20, 20)))
-            adjusted_color = (r, g, b)
-            
-            self.explosion_particles.append((center_x, center_y, adjusted_color, size, lifetime, dx, dy))
\ No newline at end of file
+        count = 20
+        u = self._rng.random((count, 3))
+        angle = u[:, 0] * math.pi * 2
+        speed = u[:, 1] * 1.5 + 0.5
+        dx = np.cos(angle) * speed * 0.5
+        dy = -speed * 2  # Always rise up
+        size = u[:, 2] * 3 + 2
+        lifetime = self._rng.integers(30, 61, count)
+        
+        # Add some variation to color
+        adjusted_color = self.jittered_colors(color, count)
+        
+        self.explosion_particles.spawn_many(center_x, center_y, adjusted_color, size, lifetime, dx, dy)
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import numpy as np
+from multiprocessing import shared_memory
+
+# Maximum number of entities that can be published in one snapshot
+MAX_ENTITIES = 512
+
+# Snapshot header; 'version' is a sequence counter that is odd while a write is in progress
+HEADER_DTYPE = np.dtype([
+    ('version', np.uint64),
+    ('count', np.int64),
+    ('wave', np.int64),
+    ('wave_progress', np.float64),
+    ('game_time', np.float64),
+], align=True)
+
+# One row per entity, with the same keys the logic process used to send as dicts
+ENTITY_DTYPE = np.dtype([
+    ('id', np.int32),
+    ('type', np.int32),
+    ('x', np.float64),
+    ('y', np.float64),
+    ('width', np.int32),
+    ('height', np.int32),
+    ('enemy_type', np.int32),
+    ('powerup_type', np.int32),
+    ('weapon_type', np.int32),
+    ('wave', np.int32),
+    ('direction', np.int32),
+    ('velocity_x', np.float64),
+    ('velocity_y', np.float64),
+    ('facing_right', np.bool_),
+], align=True)
+
+class EntityTable:
+    """Entity snapshot in shared memory, written by the logic process and read by the renderer"""
+    def __init__(self, name=None, capacity=MAX_ENTITIES):
+        create = name is None
+        size = HEADER_DTYPE.itemsize + capacity * ENTITY_DTYPE.itemsize
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        self.capacity = capacity
+        self.header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self.shm.buf)
+        self.rows = np.ndarray((capacity,), dtype=ENTITY_DTYPE, buffer=self.shm.buf,
+                               offset=HEADER_DTYPE.itemsize)
+        if create:
+            self.header.fill(0)
+
+    def __reduce__(self):
+        # Child processes attach to the existing block by name instead of copying it
+        return (self.__class__, (self.shm.name, self.capacity))
+
+    def publish(self, rows, wave, wave_progress, game_time):
+        """Write a new snapshot from a list of ENTITY_DTYPE-ordered tuples"""
+        count = min(len(rows), self.capacity)
+        version = int(self.header['version'])
+        self.header['version'] = version + 1
+        self.rows[:count] = rows[:count]
+        self.header['count'] = count
+        self.header['wave'] = wave
+        self.header['wave_progress'] = wave_progress
+        self.header['game_time'] = game_time
+        self.header['version'] = version + 2
+
+    def read(self, last_version):
+        """Copy out the snapshot if it changed since last_version; returns (version, header, rows) or None"""
+        version = int(self.header['version'])
+        if version == last_version or version & 1:
+            return None
+        header = self.header.copy()
+        rows = self.rows[:int(header['count'])].copy()
+        # A write started while copying; keep the previous snapshot and retry next frame
+        if int(self.header['version']) != version:
+            return None
+        return version, header, rows
+
+    def close(self):
+        """Release this process's mapping of the shared block"""
+        self.header = None
+        self.rows = None
+        self.shm.close()
+
+    def unlink(self):
+        """Free the shared block; called once by the process that created it"""
+        self.shm.unlink()